@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from custom_conf.initialize_config import ConfigInitializer
@@ -107,6 +109,23 @@ def pytest_configure(config):
     LOGGER.info("Pytest configuration and logging setup completed.")
 
 
+def pytest_collection_modifyitems(config, items):
+    """
+    Mark every test collected from the unittests package as 'unit'
+
+    This lets the fast, I/O free unit suite run on its own lane, e.g.
+    `pytest -n auto --dist loadfile -m unit unittests/ --run_mode local`
+
+    Args:
+        config (pytest.Config): The pytest configuration object
+        items (list[pytest.Item]): The collected test items
+    """
+    unit_tests_root = Path(str(config.rootpath)) / "unittests"
+    for item in items:
+        if unit_tests_root in Path(str(item.path)).parents:
+            item.add_marker(pytest.mark.unit)
+
+
 @pytest.fixture(scope="session")
 def all_tables_test_results():
     return {}
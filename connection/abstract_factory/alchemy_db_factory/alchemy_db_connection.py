@@ -1,14 +1,13 @@
-from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
 from connection.abstract_factory.abstract_connection import AbstractConnection
-from utils.common.sqlalchemy_util import create_sqlalchemy_url
+from utils.common.sqlalchemy_util import create_sqlalchemy_url, get_engine
 
 
 class SQLAlchemyConnection(AbstractConnection):
     """
     SQLAlchemyConnection manages a database connection using SQLAlchemy
-    It establishes and manages the connection, ensuring proper cleanup when disconnecting
+    It hands out the engine shared per database by get_engine and releases it again when disconnecting
     """
 
     def __init__(self, db_name: str, config: dict[str, str]) -> None:
@@ -20,6 +19,9 @@ class SQLAlchemyConnection(AbstractConnection):
             config (dict[str, str]): A dictionary containing database connection parameters
             such as host, port, user, password, etc
         """
+        self.db_name = db_name
+        self.config = config
+
         # Generate the connection string based on the database name and configuration
         self.connection_string = create_sqlalchemy_url(db_name, config)
 
@@ -33,18 +35,16 @@ class SQLAlchemyConnection(AbstractConnection):
         Returns:
             Engine: A SQLAlchemy engine object that allows interaction with the database
         """
-        # Create the engine with the connection string and allow SSL connections
-        self.engine = create_engine(
-            self.connection_string, connect_args={'sslmode': 'allow'}, isolation_level="AUTOCOMMIT")
+        # Reuse the shared engine (and its connection pool) for this database, created with SSL allowed
+        self.engine = get_engine(self.db_name, self.config)
         return self.engine  # Return the engine for querying the database
 
     def disconnect(self) -> None:
         """
-        Disconnect from the database by disposing of the SQLAlchemy engine
+        Disconnect from the database by releasing this object's reference to the shared SQLAlchemy engine
 
         Notes:
-            - This method ensures that the database connection is properly closed and resources are released
+            - The engine and its connection pool are shared by every connection to the same database, so they are
+              not disposed here; get_engine disposes engines when their config changes or they are evicted
         """
-        if self.engine:
-            # Dispose of the engine, closing all connections
-            self.engine.dispose()
+        self.engine = None
@@ -1,7 +1,7 @@
 from connection.connection_manager import ConnectionManager
 from utils.common.synthetic_data_util import (
-    generate_synthetic_data, generate_table_schema_from_columns,
-    insert_synthetic_data)
+    generate_table_schema_from_columns, insert_synthetic_data,
+    iter_synthetic_data)
 from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
@@ -241,8 +241,8 @@ class SynthDataHelper:
             LOGGER.info(f"Generating synthetic data for target schema {lndp_schema_name} table {lndp_table_name}")
             LOGGER.debug(f"Using columns for data generation: {columns}")
 
-            # Pass the generated schema and rows to the data generate method
-            synthetic_data = generate_synthetic_data(table_schema, rows)
+            # Pass the generated schema and rows to the data generate method, rows are produced as they are inserted
+            synthetic_data = iter_synthetic_data(table_schema, rows)
 
             # Finally insert into the relevant table
             insert_synthetic_data(db_client, lndp_schema_name, lndp_table_name, synthetic_data)
@@ -262,8 +262,8 @@ class SynthDataHelper:
             LOGGER.info(f"Generating synthetic data for target schema {edwp_schema_name} table {edwp_table_name}")
             LOGGER.debug(f"Using columns for data generation: {columns}")
 
-            # Pass the generated schema and rows to the data generate method
-            synthetic_data = generate_synthetic_data(table_schema, rows)
+            # Pass the generated schema and rows to the data generate method, rows are produced as they are inserted
+            synthetic_data = iter_synthetic_data(table_schema, rows)
 
             # Finally insert into the relevant table
             insert_synthetic_data(db_client, edwp_schema_name, edwp_table_name, synthetic_data)
@@ -283,8 +283,8 @@ class SynthDataHelper:
             LOGGER.info(f"Generating synthetic data for target schema {lndp_schema_name} table {lndp_table_name}")
             LOGGER.debug(f"Using columns for data generation: {columns}")
 
-            # Pass the generated schema and rows to the data generate method
-            synthetic_data = generate_synthetic_data(table_schema, rows)
+            # Pass the generated schema and rows to the data generate method, rows are produced as they are inserted
+            synthetic_data = iter_synthetic_data(table_schema, rows)
 
             # Finally insert into the relevant table
             insert_synthetic_data(db_client, lndp_schema_name, lndp_table_name, synthetic_data)
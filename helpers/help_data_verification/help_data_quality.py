@@ -9,8 +9,8 @@ from utils.framework.data_quality_utils.accuracy_util import \
 from utils.framework.data_quality_utils.completeness_util import (
     check_blank_rows, check_missing_column, check_src_blank_rows,
     check_src_missing_column, check_src_unexpected_nulls,
-    check_unexpected_nulls, validate_external_table_schema,
-    validate_internal_table_schema)
+    check_unexpected_nulls, clear_schema_cache,
+    validate_external_table_schema, validate_internal_table_schema)
 from utils.framework.data_quality_utils.consistency_util import (
     check_col_and_row_data_consistency, check_column_count_consistency,
     check_row_count_consistency)
@@ -189,6 +189,9 @@ class DataQualityHelper:
         Returns:
             dict: Dictionary containing all completeness checks results
         """
+        # The checks below share one catalog read per table, start from the current table definitions
+        clear_schema_cache()
+
         expected_columns = []
         config_columns = self.layer_settings['columns_info']['expected_columns']
         lndp_columns, ewdp_columns = generate_lndp_and_edwp_col_values(config_columns)
@@ -14,7 +14,7 @@ class TestAsyncFileUtils(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
         """Set up test directory and files asynchronously"""
-        self.scratch_dir = Path("unittests/scratch_dir")
+        self.scratch_dir = Path("unittests/scratch_dir_async_file_util")
         self.scratch_dir.mkdir(parents=True, exist_ok=True)
         self.test_json_file = self.scratch_dir / "test.json"
         self.test_invalid_json_file = self.scratch_dir / "invalid.json"
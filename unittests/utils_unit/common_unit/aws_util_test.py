@@ -3,13 +3,33 @@ from unittest.mock import MagicMock, patch
 
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
 
-from utils.common.aws_util import (get_glue_client, get_parameter_store_client,
+from utils.common.aws_util import (_get_boto3_session,
+                                   _get_secrets_manager_client,
+                                   get_glue_client, get_parameter_store_client,
                                    get_s3_client, get_secrets_manager_client,
                                    get_ses_client)
 
 
 class TestAWSUtil(unittest.TestCase):
 
+    def setUp(self):
+        # Each test patches boto3.Session, so drop the shared session and client cached by earlier tests
+        _get_boto3_session.cache_clear()
+        _get_secrets_manager_client.cache_clear()
+
+    def tearDown(self):
+        _get_boto3_session.cache_clear()
+        _get_secrets_manager_client.cache_clear()
+
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_clients_share_one_session(self, mock_session):
+        """Test that all clients are created from a single shared session"""
+        get_s3_client()
+        get_glue_client()
+        get_ses_client()
+        mock_session.assert_called_once()
+        self.assertEqual(mock_session.return_value.client.call_count, 3)
+
     @patch("utils.common.aws_util.boto3.Session")
     def test_get_s3_client_success(self, mock_session):
         """Test successful creation of S3 client"""
@@ -31,64 +51,70 @@ class TestAWSUtil(unittest.TestCase):
         with self.assertRaises(PartialCredentialsError):
             get_s3_client()
 
-    @patch("utils.common.aws_util.boto3.client")
-    def test_get_glue_client_success(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_get_glue_client_success(self, mock_session):
         """Test successful creation of Glue client"""
-        mock_client.return_value = MagicMock()
+        mock_session.return_value.client.return_value = MagicMock()
         client = get_glue_client()
-        mock_client.assert_called_once_with("glue")
+        mock_session.return_value.client.assert_called_once_with("glue")
         self.assertIsNotNone(client)
 
-    @patch("utils.common.aws_util.boto3.client", side_effect=NoCredentialsError)
-    def test_get_glue_client_no_credentials(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session", side_effect=NoCredentialsError)
+    def test_get_glue_client_no_credentials(self, mock_session):
         """Test NoCredentialsError when credentials are missing"""
         with self.assertRaises(NoCredentialsError):
             get_glue_client()
 
-    @patch("utils.common.aws_util.boto3.client", side_effect=PartialCredentialsError(provider="aws", cred_var="access_key"))
-    def test_get_glue_client_partial_credentials(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session", side_effect=PartialCredentialsError(provider="aws", cred_var="access_key"))
+    def test_get_glue_client_partial_credentials(self, mock_session):
         """Test PartialCredentialsError when credentials are incomplete"""
         with self.assertRaises(PartialCredentialsError):
             get_glue_client()
 
-    @patch("utils.common.aws_util.boto3.client")
-    def test_get_secrets_manager_client_success(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_get_secrets_manager_client_success(self, mock_session):
         """Test successful creation of Secrets Manager client"""
-        mock_client.return_value = MagicMock()
+        mock_session.return_value.client.return_value = MagicMock()
         client = get_secrets_manager_client()
-        mock_client.assert_called_once_with("secretsmanager")
+        mock_session.return_value.client.assert_called_once_with("secretsmanager")
         self.assertIsNotNone(client)
 
-    @patch("utils.common.aws_util.boto3.client", side_effect=NoCredentialsError)
-    def test_get_secrets_manager_client_no_credentials(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_get_secrets_manager_client_reused(self, mock_session):
+        """Test that repeated calls return the same Secrets Manager client"""
+        self.assertIs(get_secrets_manager_client(), get_secrets_manager_client())
+        mock_session.return_value.client.assert_called_once_with("secretsmanager")
+
+    @patch("utils.common.aws_util.boto3.Session", side_effect=NoCredentialsError)
+    def test_get_secrets_manager_client_no_credentials(self, mock_session):
         """Test NoCredentialsError when credentials are missing"""
         with self.assertRaises(NoCredentialsError):
             get_secrets_manager_client()
 
-    @patch("utils.common.aws_util.boto3.client")
-    def test_get_parameter_store_client_success(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_get_parameter_store_client_success(self, mock_session):
         """Test successful creation of Parameter Store client"""
-        mock_client.return_value = MagicMock()
+        mock_session.return_value.client.return_value = MagicMock()
         client = get_parameter_store_client()
-        mock_client.assert_called_once_with("ssm")
+        mock_session.return_value.client.assert_called_once_with("ssm")
         self.assertIsNotNone(client)
 
-    @patch("utils.common.aws_util.boto3.client", side_effect=NoCredentialsError)
-    def test_get_parameter_store_client_no_credentials(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session", side_effect=NoCredentialsError)
+    def test_get_parameter_store_client_no_credentials(self, mock_session):
         """Test NoCredentialsError when credentials are missing"""
         with self.assertRaises(NoCredentialsError):
             get_parameter_store_client()
 
-    @patch("utils.common.aws_util.boto3.client")
-    def test_get_ses_client_success(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session")
+    def test_get_ses_client_success(self, mock_session):
         """Test successful creation of SES client"""
-        mock_client.return_value = MagicMock()
+        mock_session.return_value.client.return_value = MagicMock()
         client = get_ses_client()
-        mock_client.assert_called_once_with("ses")
+        mock_session.return_value.client.assert_called_once_with("ses")
         self.assertIsNotNone(client)
 
-    @patch("utils.common.aws_util.boto3.client", side_effect=NoCredentialsError)
-    def test_get_ses_client_no_credentials(self, mock_client):
+    @patch("utils.common.aws_util.boto3.Session", side_effect=NoCredentialsError)
+    def test_get_ses_client_no_credentials(self, mock_session):
         """Test NoCredentialsError when credentials are missing"""
         with self.assertRaises(NoCredentialsError):
             get_ses_client()
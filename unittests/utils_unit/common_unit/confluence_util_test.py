@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import requests
 
+from utils.common import confluence_util
 from utils.common.confluence_util import (convert_confluence_content_to_yaml,
                                           extract_yaml_from_confluence_content,
                                           fetch_confluence_page_content)
@@ -48,6 +49,24 @@ class TestConfluenceUtils(unittest.TestCase):
         with self.assertRaises(TypeError):
             fetch_confluence_page_content("12345", "https://example.com", "invalid_auth")
 
+    @patch("requests.get")
+    def test_fetch_confluence_page_content_not_modified(self, mock_get):
+        """Test that an unchanged page (HTTP 304) is served from the ETag cache"""
+        confluence_util._PAGE_CACHE.clear()
+
+        first_response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        first_response.json.return_value = {"body": {"storage": {"value": "<html>cached</html>"}}}
+        not_modified_response = MagicMock(status_code=304)
+        mock_get.side_effect = [first_response, not_modified_response]
+
+        self.assertEqual(fetch_confluence_page_content("67890", "https://example.com", ("user", "token")),
+                         "<html>cached</html>")
+        self.assertEqual(fetch_confluence_page_content("67890", "https://example.com", ("user", "token")),
+                         "<html>cached</html>")
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        not_modified_response.json.assert_not_called()
+
     def test_extract_yaml_from_confluence_content(self):
         """Test extracting YAML from Confluence content"""
 
@@ -0,0 +1,81 @@
+import shutil
+import unittest
+from email import message_from_bytes
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from utils.common.email_util import (EmailBuilder, send_email_via_smtp,
+                                     send_email_with_attachment)
+
+
+class TestEmailUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch_dir = Path("unittests/scratch_dir_email_util")
+        self.scratch_dir.mkdir(parents=True, exist_ok=True)
+        self.attachment = self.scratch_dir / "my report; v1.bin"
+        self.attachment_bytes = bytes(range(256)) * 40
+        self.attachment.write_bytes(self.attachment_bytes)
+
+    def tearDown(self):
+        shutil.rmtree(self.scratch_dir)
+
+    def test_build_with_attachment(self):
+        """Test headers, body and attachment survive a round trip through the MIME parser"""
+        raw = EmailBuilder("qe@example.com").build(["a@example.com", "b@example.com"], "Results", "body text",
+                                                   str(self.attachment))
+        message = message_from_bytes(raw)
+
+        self.assertEqual(message["From"], "qe@example.com")
+        self.assertEqual(message["To"], "a@example.com, b@example.com")
+        self.assertEqual(message["Subject"], "Results")
+        body, attachment = message.get_payload()
+        self.assertEqual(body.get_payload(decode=True), b"body text")
+        self.assertEqual(attachment.get_filename(), "my report; v1.bin")
+        self.assertIn('filename="my report; v1.bin"', attachment["Content-Disposition"])
+        self.assertEqual(attachment.get_payload(decode=True), self.attachment_bytes)
+
+    def test_build_creates_independent_messages(self):
+        """Test each build starts from a fresh message with its own boundary"""
+        builder = EmailBuilder("qe@example.com")
+        first = message_from_bytes(builder.build("a@example.com", "First", "one", str(self.attachment)))
+        second = message_from_bytes(builder.build("b@example.com", "Second", "two"))
+
+        self.assertEqual(second.get_all("To"), ["b@example.com"])
+        self.assertEqual(second.get_all("Subject"), ["Second"])
+        self.assertEqual(len(second.get_payload()), 1)
+        self.assertEqual(second.get_payload()[0].get_payload(decode=True), b"two")
+        self.assertNotEqual(first.get_boundary(), second.get_boundary())
+
+    @patch("utils.common.email_util.smtplib.SMTP")
+    def test_send_email_via_smtp(self, mock_smtp):
+        """Test SMTP sends deliver the serialised message to every recipient"""
+        server = mock_smtp.return_value.__enter__.return_value
+
+        send_email_via_smtp("qe@example.com", "a@example.com", "Run 1", "body", "smtp.local", "25", None)
+        send_email_via_smtp("qe@example.com", ["a@example.com", "b@example.com"], "Run 2", "body", "smtp.local",
+                            "25", str(self.attachment))
+
+        self.assertEqual(server.sendmail.call_count, 2)
+        mock_smtp.assert_called_with("smtp.local", 25)
+        from_addr, to_addrs, raw = server.sendmail.call_args[0]
+        self.assertEqual(to_addrs, ["a@example.com", "b@example.com"])
+        self.assertEqual(message_from_bytes(raw).get_payload()[1].get_filename(), "my report; v1.bin")
+
+    def test_send_email_with_attachment_via_ses(self):
+        """Test the SES raw send receives the built message"""
+        ses_client = MagicMock()
+        ses_client.send_raw_email.return_value = {"MessageId": "id-1"}
+
+        response = send_email_with_attachment(ses_client, "qe@example.com", "a@example.com", "Results", "body",
+                                              str(self.attachment))
+
+        self.assertEqual(response, {"MessageId": "id-1"})
+        kwargs = ses_client.send_raw_email.call_args.kwargs
+        self.assertEqual(kwargs["Destinations"], ["a@example.com"])
+        message = message_from_bytes(kwargs["RawMessage"]["Data"])
+        self.assertEqual(message.get_payload()[1].get_payload(decode=True), self.attachment_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
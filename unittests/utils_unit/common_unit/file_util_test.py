@@ -1,11 +1,13 @@
 import json
+import os
 import unittest
 from pathlib import Path
 
 import yaml
 
-from utils.common.file_util import (file_exists_in_path, load_file_in_path,
-                                    load_json_file_in_path,
+from utils.common.file_util import (file_exists_in_path,
+                                    load_cached_json_file_in_path,
+                                    load_file_in_path, load_json_file_in_path,
                                     load_multiline_sql_file_in_path,
                                     load_multiple_files_in_path,
                                     load_yaml_file_in_path)
@@ -14,7 +16,7 @@ from utils.common.file_util import (file_exists_in_path, load_file_in_path,
 class TestFileUtils(unittest.TestCase):
 
     def setUp(self):
-        self.scratch_dir = Path("unittests/scratch_dir")
+        self.scratch_dir = Path("unittests/scratch_dir_file_util")
         self.scratch_dir.mkdir(parents=True, exist_ok=True)
         self.test_json_file = self.scratch_dir / "test.json"
         self.test_yaml_file = self.scratch_dir / "test.yaml"
@@ -83,6 +85,37 @@ class TestFileUtils(unittest.TestCase):
         with self.assertRaises(TypeError):
             load_file_in_path(123)
 
+    def test_load_file_in_path_cache(self):
+        """Test repeated loads are cached and a modified file is parsed again"""
+        with open(self.test_json_file, "w") as f:
+            json.dump({"key": "value"}, f)
+        first = load_file_in_path(self.test_json_file)
+        self.assertIs(load_file_in_path(self.test_json_file), first)
+
+        with open(self.test_json_file, "w") as f:
+            json.dump({"key": "changed"}, f)
+        stat = self.test_json_file.stat()
+        os.utime(self.test_json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(load_file_in_path(self.test_json_file), {"key": "changed"})
+
+    def test_load_cached_json_file_in_path_any_extension(self):
+        """Test JSON content is parsed whatever the extension, cached, and parsed again once modified"""
+        settings_file = self.scratch_dir / "settings.toml"
+        with open(settings_file, "w") as f:
+            json.dump({"dev": {"key": 1}}, f)
+        first = load_cached_json_file_in_path(settings_file)
+        self.assertEqual(first, {"dev": {"key": 1}})
+        self.assertIs(load_cached_json_file_in_path(settings_file), first)
+
+        with open(settings_file, "w") as f:
+            json.dump({"dev": {"key": 2}}, f)
+        stat = settings_file.stat()
+        os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(load_cached_json_file_in_path(settings_file), {"dev": {"key": 2}})
+
+        with self.assertRaises(FileNotFoundError):
+            load_cached_json_file_in_path(self.scratch_dir / "missing.toml")
+
     def test_load_multiple_files_in_path(self):
         """Test loading multiple files"""
         data = {"key": "value"}
@@ -125,6 +158,20 @@ class TestFileUtils(unittest.TestCase):
         # Test only comments
         self.assertEqual(load_multiline_sql_file_in_path("-- comment\n/* multi-line comment */"), [])
 
+    def test_load_multiline_sql_file_in_path_quoted_literals(self):
+        """Test comment markers and semicolons inside quotes are preserved"""
+        sql_content = """
+        SELECT '--not a comment', 'a;b' FROM users; -- trailing
+        SELECT "odd--name" FROM t/* inline */WHERE x = 'it''s';
+        """
+
+        expected_statements = [
+            "SELECT '--not a comment', 'a;b' FROM users",
+            "SELECT \"odd--name\" FROM t WHERE x = 'it''s'"
+        ]
+
+        self.assertEqual(load_multiline_sql_file_in_path(sql_content), expected_statements)
+
     def test_load_file_in_path_unsupported_file(self):
         """Test unsupported file types in load_file_in_path"""
         with open(self.test_invalid_file, "w") as f:
@@ -0,0 +1,116 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from utils.common.github_util import _build_files_query, fetch_files_content
+
+
+def _graphql_response(blobs, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {"data": {f"f{index}": blob for index, blob in enumerate(blobs)}}
+    return response
+
+
+def _blob(text, truncated=False, binary=False):
+    return {"object": {"text": text, "isTruncated": truncated, "isBinary": binary}}
+
+
+def _answer_from_query(url, json, headers, verify):
+    # Reply with the file path of every aliased lookup as its content
+    variables = json["variables"]
+    count = len(variables) // 3
+    return _graphql_response([_blob(variables[f"e{index}"].split(":", 1)[1]) for index in range(count)])
+
+
+class TestGithubUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.refs = [("owner", "repo", "main", f"sql/{index}.sql") for index in range(3)]
+
+    def test_build_files_query(self):
+        """Test every file gets its own aliased lookup with values passed as variables"""
+        query, variables = _build_files_query(self.refs[:2])
+
+        self.assertIn("f0: repository(owner: $o0, name: $n0)", query)
+        self.assertIn("f1: repository(owner: $o1, name: $n1)", query)
+        self.assertIn("text isTruncated isBinary", query)
+        self.assertNotIn("sql/0.sql", query)
+        self.assertEqual(variables["e1"], "main:sql/1.sql")
+        self.assertEqual(variables["o0"], "owner")
+
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_keeps_order(self, mock_session):
+        """Test contents come back in the order of the refs"""
+        mock_session.post.side_effect = _answer_from_query
+
+        result = fetch_files_content(self.refs, "pat", "cicd")
+
+        self.assertEqual(result, ["sql/0.sql", "sql/1.sql", "sql/2.sql"])
+        mock_session.post.assert_called_once()
+        self.assertTrue(mock_session.post.call_args.kwargs["verify"])
+
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_batches_large_requests(self, mock_session):
+        """Test more than 100 refs are split over several queries without losing order"""
+        refs = [("owner", "repo", "main", f"sql/{index}.sql") for index in range(250)]
+        mock_session.post.side_effect = _answer_from_query
+
+        result = fetch_files_content(refs, "pat", "local")
+
+        self.assertEqual(mock_session.post.call_count, 3)
+        self.assertEqual(result, [ref[3] for ref in refs])
+        self.assertFalse(mock_session.post.call_args.kwargs["verify"])
+
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_non_json_error(self, mock_session):
+        """Test an HTML error page reports the status instead of a JSON decode error"""
+        response = MagicMock(status_code=502, text="<html>Bad Gateway</html>")
+        response.json.side_effect = json.JSONDecodeError("Expecting value", "<html>", 0)
+        mock_session.post.return_value = response
+
+        with self.assertRaises(Exception) as context:
+            fetch_files_content(self.refs, "pat", "cicd")
+
+        self.assertIn("502", str(context.exception))
+        response.json.assert_not_called()
+
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_graphql_errors(self, mock_session):
+        """Test GraphQL errors in a 200 response are raised with their messages"""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"errors": [{"message": "Bad credentials"}]}
+        mock_session.post.return_value = response
+
+        with self.assertRaises(Exception) as context:
+            fetch_files_content(self.refs, "pat", "cicd")
+
+        self.assertIn("Bad credentials", str(context.exception))
+
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_missing_or_binary(self, mock_session):
+        """Test missing and binary files are reported"""
+        mock_session.post.return_value = _graphql_response([{"object": None}])
+        with self.assertRaises(Exception) as context:
+            fetch_files_content(self.refs[:1], "pat", "cicd")
+        self.assertIn("not found", str(context.exception))
+
+        mock_session.post.return_value = _graphql_response([_blob(None, binary=True)])
+        with self.assertRaises(Exception) as context:
+            fetch_files_content(self.refs[:1], "pat", "cicd")
+        self.assertIn("binary", str(context.exception))
+
+    @patch("utils.common.github_util.fetch_file_content", return_value="full script")
+    @patch("utils.common.github_util._GH_SESSION")
+    def test_fetch_files_content_truncated_blob_fetched_in_full(self, mock_session, mock_fetch_file):
+        """Test a truncated blob is read again in full from the raw endpoint"""
+        mock_session.post.return_value = _graphql_response([_blob("select"), _blob("cut off", truncated=True)])
+
+        result = fetch_files_content(self.refs[:2], "pat", "cicd")
+
+        self.assertEqual(result, ["select", "full script"])
+        mock_fetch_file.assert_called_once_with("owner", "repo", "sql/1.sql", "main", "pat", "cicd")
+
+
+if __name__ == "__main__":
+    unittest.main()
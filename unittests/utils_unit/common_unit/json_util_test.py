@@ -1,7 +1,7 @@
 import json
 import unittest
 
-from utils.common.json_util import dump_json_data
+from utils.common.json_util import dump_json_data, load_json_data
 
 
 class TestDumpJsonData(unittest.TestCase):
@@ -22,6 +22,19 @@ class TestDumpJsonData(unittest.TestCase):
         expected = json.dumps(data, indent=3)
         self.assertEqual(dump_json_data(data, 3), expected)
 
+    def test_two_space_dump_matches_stdlib(self):
+        # Test the 2-space fast path produces the same layout as the standard library
+        data = {"nested": {"list": [1, 2.5, None, True]}, "empty": {}, 1: "int key"}
+        self.assertEqual(dump_json_data(data, 2), json.dumps(data, indent=2))
+
+    def test_dump_matches_stdlib_for_edge_values(self):
+        # Test non-finite floats, integers beyond 64 bits and non-ASCII text are written exactly as json.dumps does
+        data = {"nan": float("nan"), "inf": float("inf"), "big": 2 ** 70, "name": "Zoë"}
+        for indent in (2, 4):
+            self.assertEqual(dump_json_data(data, indent), json.dumps(data, indent=indent))
+        self.assertIn("NaN", dump_json_data(data, 2))
+        self.assertIn(str(2 ** 70), dump_json_data(data, 2))
+
     def test_invalid_indent_type(self):
         # Expect TypeError for non-integer indent
         with self.assertRaises(TypeError):
@@ -37,3 +50,35 @@ class TestDumpJsonData(unittest.TestCase):
         # Expect TypeError for non-serializable data
         with self.assertRaises(TypeError):
             dump_json_data(set([1, 2, 3]), 2)  # JSON does not support set
+
+
+class TestLoadJsonData(unittest.TestCase):
+
+    def test_valid_json_load(self):
+        # Test loading from bytes and from str
+        self.assertEqual(load_json_data(b'{"key": "value"}'), {"key": "value"})
+        self.assertEqual(load_json_data('[1, 2, 3]'), [1, 2, 3])
+
+        # Test loading non-ASCII UTF-8 bytes
+        self.assertEqual(load_json_data('{"name": "Zoë"}'.encode("utf-8")), {"name": "Zoë"})
+
+    def test_load_matches_stdlib_for_edge_values(self):
+        # Test documents orjson rejects or parses differently give the standard library's result
+        documents = [
+            '{"x": NaN, "y": Infinity, "z": -Infinity}',
+            '{"x": 123456789012345678901234567890}',
+            '{"x": 18446744073709551616, "y": -9223372036854775809}',
+            '{"x": 1e400}',
+            '{"x": 0.1000000000000000000000001}',
+        ]
+        for document in documents:
+            for content in (document, document.encode("utf-8")):
+                result = load_json_data(content)
+                self.assertEqual(repr(result), repr(json.loads(content)))
+        self.assertEqual(load_json_data('{"x": 123456789012345678901234567890}'), {"x": 123456789012345678901234567890})
+        self.assertIsInstance(load_json_data(b'{"x": 18446744073709551616}')["x"], int)
+
+    def test_invalid_json_load(self):
+        # Expect JSONDecodeError (a ValueError) for malformed content
+        with self.assertRaises(json.JSONDecodeError):
+            load_json_data(b"invalid json")
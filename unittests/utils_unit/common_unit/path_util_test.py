@@ -14,7 +14,7 @@ class TestCommonPathUtil(unittest.TestCase):
     def setUpClass(cls):
         # Create the scratch_dir if it doesn't exist
         cls.scratch_dir = (
-            Path(__file__).resolve().parents[3] / "unittests" / "scratch_dir"
+            Path(__file__).resolve().parents[3] / "unittests" / "scratch_dir_path_util"
         )
         cls.scratch_dir.mkdir(exist_ok=True)
 
@@ -1,10 +1,15 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
-from utils.common.sqlalchemy_util import (create_sqlalchemy_url,
-                                          read_sql_query, run_sql_query)
+from utils.common import sqlalchemy_util
+from utils.common.sqlalchemy_util import (create_sqlalchemy_url, get_engine,
+                                          iter_sql_query,
+                                          process_query_columns,
+                                          read_sql_query, run_sql_query,
+                                          validate_sql_identifier)
 
 
 class TestSqlAlchemyUtils(unittest.TestCase):
@@ -35,6 +40,57 @@ class TestSqlAlchemyUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             create_sqlalchemy_url("invalid_db", {})
 
+    def test_get_engine_is_shared(self):
+        """Tests engines are reused per database and user"""
+        config = {
+            "aurora_host": "example.com",
+            "aurora_database": "mydb",
+            "aurora_username": "user",
+            "aurora_password": "pass"
+        }
+        engine = get_engine("aws_aurora", config)
+        self.assertIs(get_engine("aws_aurora", dict(config)), engine)
+        self.assertIsNot(get_engine("aws_aurora", {**config, "aurora_username": "other"}), engine)
+        with self.assertRaises(ValueError):
+            get_engine("unsupported_db", config)
+
+    @patch("utils.common.sqlalchemy_util._create_engine", side_effect=lambda *_: MagicMock())
+    def test_get_engine_rebuilt_after_password_rotation(self, mock_create):
+        """Tests a changed password disposes the cached engine and builds a new one"""
+        config = {
+            "aurora_host": "rotation.example.com",
+            "aurora_database": "mydb",
+            "aurora_username": "user",
+            "aurora_password": "old"
+        }
+        self.addCleanup(sqlalchemy_util._ENGINE_CONFIGS.clear)
+
+        engine = get_engine("aws_aurora", config)
+        rotated = get_engine("aws_aurora", {**config, "aurora_password": "new"})
+
+        self.assertIsNot(rotated, engine)
+        engine.dispose.assert_called_once()
+        self.assertIs(get_engine("aws_aurora", {**config, "aurora_password": "new"}), rotated)
+        self.assertEqual(mock_create.call_args[0][1]["aurora_password"], "new")
+
+    @patch("utils.common.sqlalchemy_util._create_engine", side_effect=lambda *_: MagicMock())
+    def test_get_engine_evicts_and_disposes_least_recently_used(self, _):
+        """Tests the engine cache stays bounded and disposes the engines it drops"""
+        self.addCleanup(sqlalchemy_util._ENGINE_CONFIGS.clear)
+        sqlalchemy_util._ENGINE_CONFIGS.clear()
+
+        def config(index):
+            return {"aurora_host": f"host{index}", "aurora_database": "db", "aurora_username": "user",
+                    "aurora_password": "pass"}
+
+        engines = [get_engine("aws_aurora", config(index)) for index in range(sqlalchemy_util._ENGINE_CACHE_MAX_SIZE)]
+        get_engine("aws_aurora", config(0))  # refresh the oldest so the second one is evicted next
+        get_engine("aws_aurora", config("new"))
+
+        self.assertEqual(len(sqlalchemy_util._ENGINE_CONFIGS), sqlalchemy_util._ENGINE_CACHE_MAX_SIZE)
+        engines[1].dispose.assert_called_once()
+        engines[0].dispose.assert_not_called()
+
     def test_read_sql_query(self):
         """Tests reading data from the database"""
         query = "SELECT * FROM test_table"
@@ -48,6 +104,22 @@ class TestSqlAlchemyUtils(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             read_sql_query(self.engine, "SELECT * FROM non_existent_table")
 
+    def test_iter_sql_query(self):
+        """Tests streaming rows from the database in batches"""
+        rows = iter_sql_query(self.engine, "SELECT name FROM test_table ORDER BY id", batch_size=1)
+        self.assertEqual(list(rows), [{'name': 'Alice'}, {'name': 'Bob'}])
+        with self.assertRaises(RuntimeError):
+            list(iter_sql_query(self.engine, "SELECT * FROM non_existent_table"))
+
+    @patch("utils.common.sqlalchemy_util.LOGGER")
+    def test_iter_sql_query_warns_without_server_side_cursors(self, mock_logger):
+        """Tests a dialect without server-side cursors falls back to a buffered result and says so"""
+        self.assertFalse(self.engine.dialect.supports_server_side_cursors)
+        rows = list(iter_sql_query(self.engine, "SELECT name FROM test_table ORDER BY id", batch_size=1))
+        self.assertEqual(rows, [{'name': 'Alice'}, {'name': 'Bob'}])
+        mock_logger.warning.assert_called_once()
+        self.assertIn("sqlite+pysqlite", mock_logger.warning.call_args[0][0])
+
     def test_run_sql_query(self):
         """Tests running an SQL command"""
         run_sql_query(self.engine, "INSERT INTO test_table (name) VALUES ('Charlie')")
@@ -60,3 +132,24 @@ class TestSqlAlchemyUtils(unittest.TestCase):
         """Tests running an invalid SQL command"""
         with self.assertRaises(RuntimeError):
             run_sql_query(self.engine, "INSERT INTO non_existent_table (name) VALUES ('Charlie')")
+
+    def test_validate_sql_identifier(self):
+        """Tests identifier validation for interpolated names"""
+        self.assertEqual(validate_sql_identifier("spectrum_schema"), "spectrum_schema")
+        self.assertEqual(validate_sql_identifier("s1.table_2", allow_qualified=True), "s1.table_2")
+
+        for invalid in ["s1.table_2", "1table", "name; DROP TABLE x", "", None]:
+            with self.assertRaises(ValueError):
+                validate_sql_identifier(invalid)
+
+        with self.assertRaises(ValueError):
+            validate_sql_identifier("schema.", allow_qualified=True)
+
+    def test_process_query_columns(self):
+        """Tests digit-prefixed identifiers are quoted and other queries are untouched"""
+        self.assertEqual(
+            process_query_columns("SELECT a from 2_colname numeric(31, 8)"),
+            'SELECT a from "2_colname" numeric(31, 8)'
+        )
+        self.assertEqual(process_query_columns("SELECT col_1 FROM customer1"), "SELECT col_1 FROM customer1")
+        self.assertEqual(process_query_columns("SELECT 1"), "SELECT 1")
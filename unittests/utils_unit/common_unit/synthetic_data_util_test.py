@@ -1,14 +1,17 @@
+import asyncio
 import unittest
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from faker import Faker
 from sqlalchemy import (Column, DateTime, Float, Integer, MetaData, String,
                         Table, create_engine)
 
+from utils.common import synthetic_data_util
 from utils.common.synthetic_data_util import (
-    delete_synthetic_data, ensure_src_sys_cd_column, generate_synthetic_data,
-    generate_table_schema_from_columns, insert_synthetic_data)
+    clear_reflection_cache, delete_synthetic_data, ensure_src_sys_cd_column,
+    generate_synthetic_data, generate_table_schema_from_columns,
+    insert_synthetic_data, insert_synthetic_data_async, iter_synthetic_data)
 
 fake = Faker()
 
@@ -26,6 +29,14 @@ class TestSyntheticDataUtil(unittest.TestCase):
         }
         self.assertEqual(generate_table_schema_from_columns(columns), expected_schema)
 
+    def test_generate_table_schema_from_columns_returns_copies(self):
+        """Test memoized schema parsing is not affected by callers mutating the result"""
+        columns = ["id INT", "name VARCHAR(20)"]
+        first = ensure_src_sys_cd_column(generate_table_schema_from_columns(columns))
+        first["name"][1] = 1
+
+        self.assertEqual(generate_table_schema_from_columns(columns), {"id": ["int", 10], "name": ["str", 20]})
+
     def test_ensure_src_sys_cd_column(self):
         """Test adding required metadata columns if missing"""
         schema = {"id": ["int", 10], "name": ["str", 50]}
@@ -88,6 +99,79 @@ class TestSyntheticDataUtil(unittest.TestCase):
 
         self.assertEqual(len(result), 3)
 
+    def test_insert_synthetic_data_in_batches(self):
+        """Test streaming generated rows into the database across several executemany batches"""
+        schema = generate_table_schema_from_columns(["id INT", "name VARCHAR(50)"])
+        synthetic_data = iter_synthetic_data(schema, 5)
+
+        insert_synthetic_data(self.engine, None, self.table_name, synthetic_data, batch_size=2, commit_every=2)
+
+        with self.engine.connect() as conn:
+            result = conn.execute(self.test_table.select()).fetchall()
+
+        self.assertEqual(len(result), 5)
+
+    def _failing_rows(self, good_rows):
+        yield from ({"id": idx, "name": "ok"} for idx in range(good_rows))
+        raise RuntimeError("generator failed mid-load")
+
+    def test_insert_synthetic_data_rolls_back_on_autocommit_engine(self):
+        """Test a failure after some batches leaves nothing behind, even when the engine autocommits"""
+        engine = create_engine("sqlite:///:memory:", isolation_level="AUTOCOMMIT")
+        self.metadata.create_all(engine)
+
+        with self.assertRaises(RuntimeError):
+            insert_synthetic_data(engine, None, self.table_name, self._failing_rows(4), batch_size=2)
+
+        with engine.connect() as conn:
+            result = conn.execute(self.test_table.select()).fetchall()
+        self.assertEqual(len(result), 0)
+
+    def test_insert_synthetic_data_commit_every_keeps_committed_batches(self):
+        """Test batches committed through commit_every survive a later failure on an autocommit engine"""
+        engine = create_engine("sqlite:///:memory:", isolation_level="AUTOCOMMIT")
+        self.metadata.create_all(engine)
+
+        with self.assertRaises(RuntimeError):
+            insert_synthetic_data(engine, None, self.table_name, self._failing_rows(5), batch_size=2, commit_every=2)
+
+        with engine.connect() as conn:
+            result = conn.execute(self.test_table.select()).fetchall()
+        self.assertEqual(len(result), 4)
+
+    def test_insert_synthetic_data_async(self):
+        """Test the async insert reflects the table on the sync facade and sends rows in executemany batches"""
+        rows = [{"id": idx, "name": f"row {idx}"} for idx in range(5)]
+        async_conn = MagicMock()
+        async_conn.execute = AsyncMock()
+        async_engine = MagicMock()
+        async_engine.dialect = self.engine.dialect
+        async_engine.begin.return_value.__aenter__.return_value = async_conn
+
+        with self.engine.connect() as sync_conn:
+            async_conn.run_sync = AsyncMock(side_effect=lambda fn: fn(sync_conn))
+            asyncio.run(insert_synthetic_data_async(async_engine, None, self.table_name, iter(rows), batch_size=2))
+
+        async_conn.run_sync.assert_awaited_once()
+        async_engine.begin.return_value.__aexit__.assert_awaited_once()
+        statements = [args[0] for args, _ in async_conn.execute.await_args_list]
+        batches = [args[1] for args, _ in async_conn.execute.await_args_list]
+        self.assertEqual(batches, [rows[0:2], rows[2:4], rows[4:5]])
+        self.assertEqual(statements[0].table.name, self.table_name)
+        self.assertEqual([column.name for column in statements[0].table.columns],
+                         [column.name for column in self.test_table.columns])
+        self.assertTrue(all(statement is statements[0] for statement in statements))
+
+    def test_insert_statement_reused_across_calls(self):
+        """Test the insert statement is built once per reflected table"""
+        schema = generate_table_schema_from_columns(["id INT", "name VARCHAR(50)"])
+
+        insert_synthetic_data(self.engine, None, self.table_name, generate_synthetic_data(schema, 2))
+        insert_synthetic_data(self.engine, None, self.table_name, generate_synthetic_data(schema, 2))
+
+        self.assertEqual(synthetic_data_util._insert_statement.cache_info().misses, 1)
+        self.assertEqual(synthetic_data_util._insert_statement.cache_info().hits, 1)
+
     def test_delete_synthetic_data(self):
         """Test deleting synthetic data from the database"""
         schema = generate_table_schema_from_columns(["id INT", "name VARCHAR(50)", "price NUMERIC(10,2)"])
@@ -101,6 +185,60 @@ class TestSyntheticDataUtil(unittest.TestCase):
 
         self.assertEqual(len(result), 0)
 
+    def test_copy_rows_builds_csv_payload(self):
+        """Test the PostgreSQL COPY path sends quoted columns, CSV rows and a distinct NULL marker"""
+        conn = MagicMock()
+        conn.dialect = self.engine.dialect
+        cursor = conn.connection.cursor.return_value
+        payloads = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: payloads.append((sql, buffer.read()))
+
+        rows = [{"id": 1, "name": "a,b", "price": None}, {"id": 2, "name": "", "price": 1.5}]
+        synthetic_data_util._copy_rows(conn, self.test_table, rows)
+
+        sql, payload = payloads[0]
+        self.assertEqual(sql, "COPY test_table (id, name, price) FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+        self.assertEqual(payload, '1,"a,b",\\N\r\n2,,1.5\r\n')
+        cursor.close.assert_called_once()
+
+    def test_batch_size_follows_dialect(self):
+        """Test batch sizes are picked per dialect, with SQL Server bounded by its parameter limit"""
+        self.assertEqual(synthetic_data_util._batch_size_for(self.engine, self.test_table), 500)
+
+        mssql_client = MagicMock()
+        mssql_client.dialect.name = "mssql"
+        self.assertEqual(synthetic_data_util._batch_size_for(mssql_client, self.test_table), 2100 // 6)
+
+        other_client = MagicMock()
+        other_client.dialect.name = "redshift"
+        self.assertEqual(synthetic_data_util._batch_size_for(other_client, self.test_table), 1000)
+
+    def test_table_reflection_is_cached(self):
+        """Test insert and delete reuse one reflected table per engine"""
+        schema = generate_table_schema_from_columns(["id INT"])
+        insert_synthetic_data(self.engine, None, self.table_name, generate_synthetic_data(schema, 1))
+        delete_synthetic_data(self.engine, None, self.table_name)
+
+        cache_info = synthetic_data_util._reflect_table.cache_info()
+        self.assertEqual(cache_info.currsize, 1)
+        self.assertGreaterEqual(cache_info.hits, 1)
+
+    def test_clear_reflection_cache_picks_up_recreated_table(self):
+        """Test a table recreated with a new column is reflected again once the cache is cleared"""
+        insert_synthetic_data(self.engine, None, self.table_name, [{"id": 1}])
+
+        self.metadata.drop_all(self.engine)
+        self.metadata = MetaData()
+        self.test_table = Table(self.table_name, self.metadata, Column("id", Integer), Column("extra", String(10)))
+        self.metadata.create_all(self.engine)
+
+        clear_reflection_cache()
+        insert_synthetic_data(self.engine, None, self.table_name, [{"id": 2, "extra": "new"}])
+
+        with self.engine.connect() as conn:
+            result = conn.execute(self.test_table.select()).fetchall()
+        self.assertEqual([tuple(row) for row in result], [(2, "new")])
+
     def test_generate_synthetic_data_empty_schema(self):
         """Test generating synthetic data with an empty schema"""
         empty_schema = {}
@@ -127,9 +265,35 @@ class TestSyntheticDataUtil(unittest.TestCase):
         """Test secure random integer generation"""
         mock_choice.return_value = 42
         schema = {"id": ["int", 10]}
-        data = generate_synthetic_data(schema, 1)
+        data = generate_synthetic_data(schema, 1, secure_random=True)
         self.assertEqual(data[0]["id"], 42)
 
+    def test_generate_synthetic_data_vectorized_ranges(self):
+        """Test column-wise generated values are native Python types within the expected ranges"""
+        schema = {"id": ["int", 10], "co_nbr": ["str", 10], "price": ["float", 10.1], "flag": ["boolean", None]}
+        data = generate_synthetic_data(schema, 2500)
+
+        self.assertEqual(len(data), 2500)
+        for row in data:
+            self.assertIs(type(row["id"]), int)
+            self.assertTrue(1 <= row["id"] <= 10)
+            self.assertTrue(1 <= int(row["co_nbr"]) <= 200)
+            self.assertIs(type(row["price"]), float)
+            self.assertTrue(0 <= row["price"] <= 10)
+            self.assertIs(type(row["flag"]), bool)
+
+    @patch("utils.common.synthetic_data_util.secrets")
+    def test_generate_synthetic_data_default_path_skips_secrets(self, mock_secrets):
+        """Test the default path never draws from the OS CSPRNG"""
+        schema = generate_table_schema_from_columns(
+            ["id INT", "co_nbr VARCHAR(5)", "name VARCHAR(20)", "price NUMERIC(10,2)", "rate REAL",
+             "flag BOOLEAN", "day DATE"]
+        )
+        data = generate_synthetic_data(schema, 3)
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(mock_secrets.mock_calls, [])
+
     def test_generate_synthetic_data_empty_date_fields(self):
         """Test that columns ending with '_dt' remain empty"""
         schema = {"event_dt": ["str", 20]}
@@ -139,3 +303,4 @@ class TestSyntheticDataUtil(unittest.TestCase):
     def tearDown(self):
         """Drop all tables and clean up the in-memory database"""
         self.metadata.drop_all(self.engine)
+        clear_reflection_cache()
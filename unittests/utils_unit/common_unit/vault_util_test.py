@@ -1,12 +1,19 @@
 import unittest
 from unittest.mock import patch
 
-from utils.common.vault_util import (load_secrets_from_vault,
+from utils.common.vault_util import (clear_vault_cache,
+                                     load_secrets_from_vault,
                                      save_secrets_to_vault)
 
 
 class TestVaultUtil(unittest.TestCase):
 
+    def setUp(self):
+        clear_vault_cache()
+
+    def tearDown(self):
+        clear_vault_cache()
+
     @patch("hvac.Client")
     def test_get_secrets_from_vault(self, mock_client):
         # Mock the Vault client and the secret retrieval
@@ -38,3 +45,24 @@ class TestVaultUtil(unittest.TestCase):
         mock_instance.secrets.kv.v2.create_or_update_secret.assert_called_with(
             path=secret_path, secret=secrets
         )
+
+    @patch("hvac.Client")
+    def test_secrets_are_cached_until_saved(self, mock_client):
+        # Repeated reads share one client and one Vault round trip, a save invalidates the cached secret
+        mock_instance = mock_client.return_value
+        read_secret = mock_instance.secrets.kv.v2.read_secret_version
+        read_secret.return_value = {"data": {"data": {"key": "value"}}}
+
+        vault_url = "http://127.0.0.1:8200"
+        token = "s.myvaulttoken"
+        secret_path = "secret/data/mysecret"
+
+        first = load_secrets_from_vault(vault_url, token, secret_path)
+        first["key"] = "mutated"
+        self.assertEqual(load_secrets_from_vault(vault_url, token, secret_path), {"key": "value"})
+        self.assertEqual(read_secret.call_count, 1)
+        mock_client.assert_called_once()
+
+        save_secrets_to_vault(vault_url, token, secret_path, {"key": "new"})
+        load_secrets_from_vault(vault_url, token, secret_path)
+        self.assertEqual(read_secret.call_count, 2)
@@ -37,20 +37,29 @@ class TestCustomConfUtil(unittest.TestCase):
             "trigger_counter": 99
         }
 
-    @patch("utils.framework.custom_conf_util.load_json_file_in_path")
+    @patch("utils.framework.custom_conf_util.load_cached_json_file_in_path")
     def test_load_layered_settings_valid(self, mock_load_json):
         """Test loading layered settings with valid environment"""
         mock_load_json.return_value = {"dev": {"key1": "value1"}}
         result = load_layered_settings(self.file_path, self.environment)
         self.assertEqual(result, {"key1": "value1"})
 
-    @patch("utils.framework.custom_conf_util.load_json_file_in_path")
+    @patch("utils.framework.custom_conf_util.load_cached_json_file_in_path")
     def test_load_layered_settings_missing_env(self, mock_load_json):
         """Test loading settings when environment is missing"""
         mock_load_json.return_value = {"prod": {"key2": "value2"}}
         result = load_layered_settings(self.file_path, self.environment)
         self.assertEqual(result, {})
 
+    @patch("utils.framework.custom_conf_util.load_cached_json_file_in_path")
+    def test_load_layered_settings_returns_copy(self, mock_load_json):
+        """Test that mutating the returned settings does not change the cached file data"""
+        cached = {"dev": {"nested": {"key1": "value1"}}}
+        mock_load_json.return_value = cached
+        result = load_layered_settings(self.file_path, self.environment)
+        result["nested"]["key1"] = "changed"
+        self.assertEqual(cached["dev"]["nested"]["key1"], "value1")
+
     def test_get_remote_secret_config_params_vault(self):
         """Test fetching Vault-based remote secret config"""
         result = get_remote_secret_config_params(self.init_params, self.env_vars, self.remote_path)
@@ -126,6 +135,13 @@ class TestCustomConfUtil(unittest.TestCase):
             recursive_merge({"a": {"b": 1}}, {"a": {"b": 2}, "new_key": 3})
         self.assertIn("New key 'new_key'", str(context.exception))
 
+    def test_recursive_merge_empty_table_returns_copy(self):
+        """Test an empty table dict yields a shallow copy of the default"""
+        default = {"a": {"b": 1}, "c": 2}
+        result = recursive_merge(default, {})
+        self.assertEqual(result, default)
+        self.assertIsNot(result, default)
+
     def test_merge_test_scope_diff_and_null(self):
         default = {"a": 1, "b": [1, 2], "c": {"x": 10}, "d": None}
         table = {"a": 2, "b": [1], "c": {"x": 10}, "d": None}
@@ -135,6 +151,12 @@ class TestCustomConfUtil(unittest.TestCase):
         self.assertEqual(result["c"], {"x": None})  # matching nested dict → kept structure with None
         self.assertIsNone(result["d"])  # identical None → stays None
 
+    def test_merge_test_scope_unhashable_list_items(self):
+        default = {"b": [{"x": 1}, {"y": 2}]}
+        table = {"b": [{"x": 1}]}
+        result = merge_test_scope(default, table)
+        self.assertEqual(result["b"], [{"y": 2}])  # dict entries fall back to list membership
+
     def test_merge_test_scope_with_extra_keys_raises(self):
         default = {"a": 1}
         table = {"a": 1, "extra": 2}
@@ -24,7 +24,7 @@ class TestCustomPathUtil(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.scratch_dir = (
-            Path(__file__).resolve().parents[3] / "unittests" / "scratch_dir"
+            Path(__file__).resolve().parents[3] / "unittests" / "scratch_dir_custom_path_util"
         )
         cls.scratch_dir.mkdir(parents=True, exist_ok=True)
 
@@ -51,6 +51,18 @@ class TestCustomPathUtil(unittest.TestCase):
         self.assertTrue(root_path.exists())
         self.assertTrue((root_path / "unittests").exists())
 
+    def test_get_framework_root_path_cached(self):
+        # The framework root is resolved once and reused afterwards
+        get_framework_root_path.cache_clear()
+        with patch("utils.framework.custom_path_util.find_project_root", return_value=self.scratch_dir) as mock_find:
+            first = get_framework_root_path()
+            second = get_framework_root_path()
+        get_framework_root_path.cache_clear()
+
+        self.assertEqual(first, self.scratch_dir)
+        self.assertIs(first, second)
+        mock_find.assert_called_once()
+
     def test_get_teams_root_folder_path(self):
         # Test getting the teams root folder path
         teams_path = get_teams_root_folder_path()
@@ -0,0 +1,100 @@
+import io
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from utils.framework.custom_s3_util import (_YAML_CACHE,
+                                            read_default_scope_yml_from_s3,
+                                            read_many_table_yamls_from_s3,
+                                            read_table_yaml_from_s3)
+
+
+def _s3_response(body, etag='"abc"'):
+    return {"Body": io.BytesIO(body), "ETag": etag}
+
+
+def _not_modified():
+    return ClientError({"Error": {"Code": "304", "Message": "Not Modified"},
+                        "ResponseMetadata": {"HTTPStatusCode": 304}}, "GetObject")
+
+
+class TestCustomS3Util(unittest.TestCase):
+
+    def setUp(self):
+        _YAML_CACHE.clear()
+        self.s3_client = MagicMock()
+        self.s3_client.exceptions.NoSuchKey = type("NoSuchKey", (ClientError,), {})
+        patcher = patch("utils.framework.custom_s3_util.get_s3_client", return_value=self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        _YAML_CACHE.clear()
+
+    def test_read_table_yaml_from_s3(self):
+        """Test the table YAML is fetched from the expected key and parsed"""
+        self.s3_client.get_object.return_value = _s3_response(b"test_scope:\n  cicd: [a]\n")
+
+        result = read_table_yaml_from_s3("data-checks/seed/", "orders", "bucket")
+
+        self.assertEqual(result, {"test_scope": {"cicd": ["a"]}})
+        self.s3_client.get_object.assert_called_once_with(Bucket="bucket", Key="data-checks/seed/orders.yaml")
+
+    def test_unchanged_object_served_from_cache(self):
+        """Test a 304 on revalidation returns an independent copy of the cached parse"""
+        self.s3_client.get_object.side_effect = [_s3_response(b"test_scope:\n  cicd: [a]\n"), _not_modified()]
+
+        first = read_default_scope_yml_from_s3("data-checks/seed/", "DEFAULT_SCOPE", "bucket")
+        first["test_scope"] = first["test_scope"]["cicd"]
+        second = read_default_scope_yml_from_s3("data-checks/seed/", "DEFAULT_SCOPE", "bucket")
+
+        self.assertEqual(second, {"test_scope": {"cicd": ["a"]}})
+        self.s3_client.get_object.assert_called_with(
+            Bucket="bucket", Key="data-checks/seed/DEFAULT_SCOPE.yml", IfNoneMatch='"abc"'
+        )
+
+    def test_changed_object_is_reparsed(self):
+        """Test a new body returned on revalidation replaces the cached parse"""
+        self.s3_client.get_object.side_effect = [_s3_response(b"a: 1\n"), _s3_response(b"a: 2\n", etag='"def"')]
+
+        read_table_yaml_from_s3("p/", "t", "bucket")
+        result = read_table_yaml_from_s3("p/", "t", "bucket")
+
+        self.assertEqual(result, {"a": 2})
+        self.assertEqual(_YAML_CACHE[("bucket", "p/t.yaml")][0], '"def"')
+
+    def test_read_many_table_yamls_keeps_input_order(self):
+        """Test the batch read returns every table's config keyed and ordered by table name"""
+        bodies = {"p/b.yaml": b"name: b\n", "p/a.yaml": b"name: a\n", "p/c.yaml": b"name: c\n"}
+        self.s3_client.get_object.side_effect = lambda Bucket, Key: _s3_response(bodies[Key])
+
+        result = read_many_table_yamls_from_s3("p/", ["b", "a", "c"], "bucket")
+
+        self.assertEqual(list(result), ["b", "a", "c"])
+        self.assertEqual(result["a"], {"name": "a"})
+        self.assertEqual(self.s3_client.get_object.call_count, 3)
+
+    def test_read_many_table_yamls_missing_table(self):
+        """Test a missing table in the batch surfaces as FileNotFoundError"""
+        def get_object(Bucket, Key):
+            if Key == "p/b.yaml":
+                raise self.s3_client.exceptions.NoSuchKey({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+            return _s3_response(b"a: 1\n")
+        self.s3_client.get_object.side_effect = get_object
+
+        with self.assertRaises(FileNotFoundError):
+            read_many_table_yamls_from_s3("p/", ["a", "b"], "bucket")
+
+    def test_missing_object_raises_file_not_found(self):
+        """Test a missing key is reported as FileNotFoundError"""
+        self.s3_client.get_object.side_effect = self.s3_client.exceptions.NoSuchKey(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+
+        with self.assertRaises(FileNotFoundError):
+            read_table_yaml_from_s3("p/", "t", "bucket")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from utils.framework.data_quality_utils.completeness_util import (
     check_missing_column, check_blank_rows, check_unexpected_nulls,
     check_src_missing_column, check_src_blank_rows, check_src_unexpected_nulls,
     validate_external_table_schema, validate_internal_table_schema,
+    clear_schema_cache,
 )
 
 
@@ -16,6 +17,10 @@ class TestCompletenessUtil(unittest.TestCase):
         self.table = "users"
         self.columns = ["id", "name", "email"]
         self.test_cols_for_nulls = ["name", "email"]
+        clear_schema_cache()
+
+    def tearDown(self):
+        clear_schema_cache()
 
     # === check_missing_column ===
 
@@ -32,6 +37,23 @@ class TestCompletenessUtil(unittest.TestCase):
         self.assertFalse(result["status"])
         self.assertIn("name", result["test_details"]["missing_columns"])
 
+    @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
+    def test_catalog_read_once_per_table(self, mock_read_sql):
+        mock_read_sql.side_effect = [
+            [{"column_name": col, "data_type": "integer", "character_maximum_length": None,
+              "numeric_precision": None, "numeric_scale": None} for col in self.columns],
+            [{"blank_row_count": 0}],
+        ]
+        check_missing_column(self.client, self.schema, self.table, self.columns)
+        validate_internal_table_schema(self.client, self.schema, self.table, {"id": "integer"})
+        check_blank_rows(self.client, self.schema, self.table)
+        self.assertEqual(mock_read_sql.call_count, 2)
+
+        clear_schema_cache()
+        mock_read_sql.side_effect = [[{"column_name": "id"}]]
+        result = check_missing_column(self.client, self.schema, self.table, self.columns)
+        self.assertFalse(result["status"])
+
     # === check_blank_rows ===
 
     @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
@@ -65,13 +87,20 @@ class TestCompletenessUtil(unittest.TestCase):
 
     @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
     def test_check_unexpected_nulls_with_nulls(self, mock_read_sql):
-        mock_read_sql.side_effect = [
-            [{"null_count": 2}],
-            [{"null_count": 0}]
-        ]
+        mock_read_sql.return_value = [{"null_count_0": 2, "null_count_1": 0}]
         result = check_unexpected_nulls(self.client, self.schema, self.table, self.test_cols_for_nulls)
         self.assertFalse(result["status"])
-        self.assertIn("name", result["test_details"]["columns_with_nulls"])
+        self.assertEqual(result["test_details"]["columns_with_nulls"], ["name"])
+        mock_read_sql.assert_called_once()
+        query = mock_read_sql.call_args[0][1]
+        self.assertIn("SUM(CASE WHEN name IS NULL THEN 1 ELSE 0 END) AS null_count_0", query)
+        self.assertIn("SUM(CASE WHEN email IS NULL THEN 1 ELSE 0 END) AS null_count_1", query)
+
+    @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
+    def test_check_unexpected_nulls_empty_table(self, mock_read_sql):
+        mock_read_sql.return_value = [{"null_count_0": None, "null_count_1": None}]
+        result = check_unexpected_nulls(self.client, self.schema, self.table, self.test_cols_for_nulls)
+        self.assertTrue(result["status"])
 
     @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
     def test_check_unexpected_nulls_all_allowed(self, _):
@@ -110,7 +139,7 @@ class TestCompletenessUtil(unittest.TestCase):
 
     @patch("utils.framework.data_quality_utils.completeness_util.read_sql_query")
     def test_check_src_unexpected_nulls_with_nulls(self, mock_read_sql):
-        mock_read_sql.side_effect = [[{"null_count": 1}], [{"null_count": 0}]]
+        mock_read_sql.return_value = [{"null_count_0": 1, "null_count_1": 0}]
         result = check_src_unexpected_nulls(self.client, self.schema, self.table, self.test_cols_for_nulls)
         self.assertFalse(result["status"])
         self.assertIn("name", result["test_details"]["columns_with_nulls"])
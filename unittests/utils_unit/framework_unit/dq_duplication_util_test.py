@@ -110,7 +110,7 @@ class TestDuplicationUtil(unittest.TestCase):
         self.assertIn("Duplicate rows detected", result["test_details"]["message"])
 
     def test_column_regex_failure(self):
-        # Simulates what happens if a column name is just spaces (re.match().group() fails)
-        with self.assertRaises(AttributeError):
+        # A column definition without a leading column name is rejected with a clear error
+        with self.assertRaisesRegex(ValueError, "Invalid column definition"):
             check_src_row_duplicates(self.engine, self.schema_name, self.table_name,
                                      ["   "], ["id"])
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from utils.framework.data_validation_utils.scd_util import \
+    run_lndp_edwp_script_for_scd_tables
+
+
+class TestScdUtil(unittest.TestCase):
+
+    def setUp(self):
+        self.db_client = MagicMock()
+        self.scd_settings = {
+            "lndp_to_edwp_sqls": [
+                "https://github.com/owner/repo/blob/main/sql/first.sql",
+                "https://github.com/owner/repo/blob/dev/sql/second.sql",
+            ]
+        }
+
+    @patch("utils.framework.data_validation_utils.scd_util.clear_reflection_cache")
+    @patch("utils.framework.data_validation_utils.scd_util.run_sql_query")
+    @patch("utils.framework.data_validation_utils.scd_util.fetch_files_content")
+    def test_scripts_fetched_in_one_batch_and_run_in_order(self, mock_fetch, mock_run, mock_clear):
+        mock_fetch.return_value = ["delete from a;\ninsert into a select 1;", "update b set c = 1;"]
+
+        run_lndp_edwp_script_for_scd_tables(self.db_client, self.scd_settings, "pat", "cicd")
+
+        mock_fetch.assert_called_once_with(
+            [("owner", "repo", "main", "sql/first.sql"), ("owner", "repo", "dev", "sql/second.sql")], "pat", "cicd"
+        )
+        self.assertEqual(mock_run.call_args_list, [
+            call(self.db_client, "delete from a"),
+            call(self.db_client, "insert into a select 1"),
+            call(self.db_client, "update b set c = 1"),
+        ])
+        mock_clear.assert_called_once()
+
+    @patch("utils.framework.data_validation_utils.scd_util.run_sql_query")
+    @patch("utils.framework.data_validation_utils.scd_util.fetch_files_content")
+    def test_no_scripts_configured(self, mock_fetch, mock_run):
+        run_lndp_edwp_script_for_scd_tables(self.db_client, {}, "pat", "cicd")
+
+        mock_fetch.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch("utils.framework.data_validation_utils.scd_util.run_sql_query")
+    @patch("utils.framework.data_validation_utils.scd_util.fetch_files_content")
+    def test_fetch_failure_runs_nothing(self, mock_fetch, mock_run):
+        mock_fetch.side_effect = Exception("Error fetching files: 502 - Bad Gateway")
+
+        with self.assertRaises(Exception):
+            run_lndp_edwp_script_for_scd_tables(self.db_client, self.scd_settings, "pat", "cicd")
+
+        mock_run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
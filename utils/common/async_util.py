@@ -1,10 +1,13 @@
 import asyncio
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
 import aiofiles
 
+from utils.common.json_util import load_json_data
+
 
 async def async_load_json_file_in_path(file_path: str | Path) -> dict[str, Any]:
     """
@@ -35,12 +38,13 @@ async def async_load_json_file_in_path(file_path: str | Path) -> dict[str, Any]:
     if not path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    async with aiofiles.open(path, "r", encoding="utf-8") as file:
-        try:
-            content = await file.read()
-            return json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON file: {file_path}") from e
+    async with aiofiles.open(path, "rb") as file:
+        content = await file.read()
+
+    try:
+        return load_json_data(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON file: {file_path}") from e
 
 
 async def async_load_file_in_path(file_path: str | Path) -> dict[str, Any]:
@@ -98,5 +102,16 @@ async def async_load_multiple_files(file_paths: list[str | Path]) -> list[dict[s
     if not isinstance(file_paths, list) or any(not isinstance(fp, (str, Path)) for fp in file_paths):
         raise TypeError("file_paths must be a list of strings or Path objects")
 
-    tasks = [async_load_file_in_path(file_path) for file_path in file_paths]
-    return list(await asyncio.gather(*tasks))
+    if sys.version_info < (3, 11):
+        tasks = [async_load_file_in_path(file_path) for file_path in file_paths]
+        return list(await asyncio.gather(*tasks))
+
+    # TaskGroup cancels the remaining loads as soon as one of them fails
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(async_load_file_in_path(file_path)) for file_path in file_paths]
+    except ExceptionGroup as e:
+        # Surface the first failure so callers keep receiving the documented exception types
+        raise e.exceptions[0] from None
+
+    return [task.result() for task in tasks]
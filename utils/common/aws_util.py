@@ -1,9 +1,31 @@
+from functools import lru_cache
 from typing import Any
 
 import boto3
+import botocore.session
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
 
 
+@lru_cache(maxsize=1)
+def _get_boto3_session() -> boto3.Session:
+    """
+    Create the boto3 session shared by every client factory in this module
+
+    Building all clients from one session reuses the botocore loader cache (service models,
+    endpoint data) and the credential resolver chain instead of re-reading them per client
+
+    Returns:
+        boto3.Session: Shared boto3 session object
+    """
+    return boto3.Session(botocore_session=botocore.session.get_session())
+
+
+@lru_cache(maxsize=1)
+def _get_secrets_manager_client() -> Any:
+    # Secrets are read once per generated config or connection, reuse one client and its connection pool for all of them
+    return _get_boto3_session().client("secretsmanager")
+
+
 def get_s3_client() -> Any:
     """
     Create and return a boto3 S3 client for interacting with S3 service
@@ -20,8 +42,7 @@ def get_s3_client() -> Any:
         >>> s3.list_buckets()
     """
     try:
-        session = boto3.Session()
-        return session.client("s3")
+        return _get_boto3_session().client("s3")
     except NoCredentialsError:
         raise NoCredentialsError()
     except PartialCredentialsError:
@@ -44,7 +65,7 @@ def get_glue_client() -> Any:
         >>> glue.get_jobs()
     """
     try:
-        return boto3.client("glue")
+        return _get_boto3_session().client("glue")
     except NoCredentialsError:
         raise NoCredentialsError()
     except PartialCredentialsError:
@@ -53,7 +74,9 @@ def get_glue_client() -> Any:
 
 def get_secrets_manager_client() -> Any:
     """
-    Create and return a boto3 Secrets Manager client for interacting with Secrets Manager service
+    Return the shared boto3 Secrets Manager client for interacting with Secrets Manager service
+
+    The client is created once and reused, boto3 clients are thread-safe
 
     Returns:
         boto3.SecretsManager.Client: Secrets Manager client object
@@ -67,7 +90,7 @@ def get_secrets_manager_client() -> Any:
         >>> secrets.list_secrets()
     """
     try:
-        return boto3.client("secretsmanager")
+        return _get_secrets_manager_client()
     except NoCredentialsError:
         raise NoCredentialsError()
     except PartialCredentialsError:
@@ -90,7 +113,7 @@ def get_parameter_store_client() -> Any:
         >>> secrets.list_secrets()
     """
     try:
-        return boto3.client("ssm")
+        return _get_boto3_session().client("ssm")
     except NoCredentialsError:
         raise NoCredentialsError()
     except PartialCredentialsError:
@@ -113,7 +136,7 @@ def get_ses_client() -> Any:
         >>> ses.list_identities()
     """
     try:
-        return boto3.client("ses")
+        return _get_boto3_session().client("ses")
     except NoCredentialsError:
         raise NoCredentialsError()
     except PartialCredentialsError:
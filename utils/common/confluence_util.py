@@ -1,9 +1,16 @@
+from collections import OrderedDict
 from typing import Any
 
 import requests
 import yaml
 from bs4 import BeautifulSoup
 
+# LRU cache of (confluence_url, page_id) -> (ETag, page content) used for conditional requests
+_PAGE_CACHE_MAX_SIZE = 128
+_PAGE_CACHE: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+
+_PAGE_URL_FORMAT = "{base}/rest/api/content/{page_id}?expand=body.storage".format
+
 
 def fetch_confluence_page_content(
     page_id: str, confluence_url: str, auth: tuple[str, str]
@@ -29,19 +36,38 @@ def fetch_confluence_page_content(
         ... )
         "<html>...</html>"
     """
-    if not all(isinstance(arg, str) for arg in (page_id, confluence_url)) or not isinstance(auth, tuple):
+    if type(page_id) is not str or type(confluence_url) is not str or not isinstance(auth, tuple):
         raise TypeError("Invalid argument types: page_id and confluence_url "
                         "must be strings, auth must be a tuple")
 
-    url = f"{confluence_url}/rest/api/content/{page_id}?expand=body.storage"
-    response = requests.get(url, auth=auth)
+    cache_key = (confluence_url, page_id)
+    cached = _PAGE_CACHE.get(cache_key)
+    headers = {'If-None-Match': cached[0]} if cached else {}
+
+    url = _PAGE_URL_FORMAT(base=confluence_url, page_id=page_id)
+    response = requests.get(url, auth=auth, headers=headers)
+
+    # Page unchanged since the last fetch - skip the body transfer and JSON decode
+    if cached and response.status_code == 304:
+        _PAGE_CACHE.move_to_end(cache_key)
+        return cached[1]
+
     response.raise_for_status()
 
     content = response.json()
     if 'body' not in content or 'storage' not in content['body'] or 'value' not in content['body']['storage']:
         raise ValueError("Invalid response structure from Confluence API")
 
-    return content['body']['storage']['value']
+    page_content = content['body']['storage']['value']
+
+    etag = response.headers.get('ETag')
+    if etag:
+        _PAGE_CACHE[cache_key] = (etag, page_content)
+        _PAGE_CACHE.move_to_end(cache_key)
+        if len(_PAGE_CACHE) > _PAGE_CACHE_MAX_SIZE:
+            _PAGE_CACHE.popitem(last=False)
+
+    return page_content
 
 
 def extract_yaml_from_confluence_content(content: str) -> str:
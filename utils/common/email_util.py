@@ -1,13 +1,88 @@
+import binascii
 import os
 import smtplib
-from email import encoders
-from email.mime.application import MIMEApplication
+from email.generator import BytesGenerator
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from io import BytesIO
 
 from botocore.exceptions import ClientError
 
+# Default upper bound on how much of a log file is embedded in an email body
+MAX_LOG_TAIL_BYTES = 256 * 1024
+
+# 57 raw bytes encode to exactly one 76 character base64 line (RFC 2045)
+_BASE64_LINE_BYTES = 57
+_BASE64_READ_BYTES = _BASE64_LINE_BYTES * 1024
+
+
+def _encode_file_as_base64(file_obj):
+    """
+    Base64 encode a binary file object into RFC 2045 folded lines.
+
+    Args:
+        file_obj (BinaryIO): The file object opened in binary mode.
+
+    Returns:
+        str: The base64 encoded content, one 76 character line per 57 input bytes.
+    """
+    encoded = bytearray()
+    for chunk in iter(lambda: file_obj.read(_BASE64_READ_BYTES), b''):
+        for start in range(0, len(chunk), _BASE64_LINE_BYTES):
+            encoded += binascii.b2a_base64(chunk[start:start + _BASE64_LINE_BYTES])
+    return encoded.decode('ascii')
+
+
+class EmailBuilder:
+    """
+    MIME message builder for emails sent from one sender.
+
+    Every call to `build` assembles a fresh multipart message, so builders hold no per-message
+    state and each message gets its own boundary.
+    """
+
+    __slots__ = ("_sender_email",)
+
+    def __init__(self, sender_email):
+        """
+        Args:
+            sender_email (str): The email address every built message is sent from.
+        """
+        self._sender_email = sender_email
+
+    def build(self, recipient_email, subject, body_text, attachment_path=None, charset="UTF-8"):
+        """
+        Build a serialised email message.
+
+        Args:
+            recipient_email (str | list): The recipient's email address or a list of addresses.
+            subject (str): The subject line of the email.
+            body_text (str): The plain text body of the email.
+            attachment_path (str, optional): Path to a file to attach. Defaults to None.
+            charset (str, optional): The character set for the body. Defaults to 'UTF-8'.
+
+        Returns:
+            bytes: The complete MIME message, ready for SMTP or SES raw sending.
+        """
+        msg = MIMEMultipart()
+        msg["From"] = self._sender_email
+        msg["To"] = ", ".join(recipient_email) if isinstance(recipient_email, list) else recipient_email
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body_text, "plain", charset))
+
+        if attachment_path:
+            with open(attachment_path, "rb") as attachment:
+                part = MIMEBase("application", "octet-stream")
+                part.set_payload(_encode_file_as_base64(attachment))
+            part["Content-Transfer-Encoding"] = "base64"
+            part.add_header("Content-Disposition", "attachment", filename=os.path.basename(attachment_path))
+            msg.attach(part)
+
+        buffer = BytesIO()
+        BytesGenerator(buffer).flatten(msg)
+        return buffer.getvalue()
+
 
 def send_email(ses_client, sender_email, recipient_email, subject, body_text, charset="UTF-8"):
     """
@@ -64,25 +139,13 @@ def send_email_with_attachment(
         ClientError: If there is an issue with the SES request.
     """
     try:
-        msg = MIMEMultipart()
-        msg["Subject"] = subject
-        msg["From"] = sender_email
-        msg["To"] = recipient_email
-
-        msg.attach(MIMEText(body_text, "plain", charset))
-
-        with open(attachment_path, "rb") as attachment:
-            part = MIMEBase("application", "octet-stream")
-            part.set_payload(attachment.read())
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition", f"attachment; filename={os.path.basename(attachment_path)}")
-            msg.attach(part)
+        raw_message = EmailBuilder(sender_email).build(
+            recipient_email, subject, body_text, attachment_path, charset)
 
         response = ses_client.send_raw_email(
             Source=sender_email,
             Destinations=[recipient_email],
-            RawMessage={"Data": msg.as_string()}
+            RawMessage={"Data": raw_message}
         )
         print(f"Email with attachment sent! Message ID: {response['MessageId']}")
         return response
@@ -91,19 +154,27 @@ def send_email_with_attachment(
         raise e
 
 
-def create_email_body_from_log(log_file_path):
+def create_email_body_from_log(log_file_path, max_tail_bytes=MAX_LOG_TAIL_BYTES):
     """
-    Create the body of the email by reading the log file.
+    Create the body of the email by reading the tail of the log file.
+
+    Only the last `max_tail_bytes` bytes are read so that large rotating logs are not
+    loaded into memory in full just to be embedded in an email body.
 
     Args:
         log_file_path (str): The path to the log file.
+        max_tail_bytes (int | None, optional): Maximum number of bytes to read from the end
+            of the log file. Pass None to read the whole file. Defaults to MAX_LOG_TAIL_BYTES.
 
     Returns:
-        str: The content of the log file as the body of the email.
+        str: The (tail) content of the log file as the body of the email.
     """
     try:
-        with open(log_file_path, 'r') as log_file:
-            return log_file.read()
+        file_size = os.path.getsize(log_file_path)
+        with open(log_file_path, 'rb') as log_file:
+            if max_tail_bytes is not None and file_size > max_tail_bytes:
+                log_file.seek(file_size - max_tail_bytes)
+            return log_file.read().decode('utf-8', errors='replace')
     except FileNotFoundError:
         print(f"Log file not found: {log_file_path}")
         return "Log file not found."
@@ -142,23 +213,12 @@ def send_email_via_smtp(from_addr, to_addr, subject, body, smtp_server, smtp_por
         Exception: If sending the email fails.
     """
     try:
-        msg = MIMEMultipart()
-        msg['From'] = from_addr
-        msg['To'] = ", ".join(to_addr) if isinstance(to_addr, list) else to_addr
-        msg['Subject'] = subject
-
-        msg.attach(MIMEText(body, 'plain'))
-
-        if attachment_file_path:
-            with open(attachment_file_path, 'rb') as attachment:
-                part = MIMEApplication(attachment.read(), Name=attachment_file_path)
-                part['Content-Disposition'] = f'attachment; filename="{attachment_file_path}"'
-                msg.attach(part)
+        raw_message = EmailBuilder(from_addr).build(to_addr, subject, body, attachment_file_path)
 
         to_addrs = to_addr if isinstance(to_addr, list) else [to_addr]
 
         with smtplib.SMTP(smtp_server, int(smtp_port)) as server:
-            server.sendmail(from_addr, to_addrs, msg.as_string())
+            server.sendmail(from_addr, to_addrs, raw_message)
 
         print(f"Email sent successfully to {', '.join(to_addrs)}")
     except Exception as e:
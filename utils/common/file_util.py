@@ -1,10 +1,28 @@
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from utils.common.json_util import load_json_data
+
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml, fall back to the pure-Python loader
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# Upper bound on parsed files kept by load_file_in_path, keyed on path, mtime and size
+_FILE_CACHE_MAX_SIZE = 256
+
+# Upper bound on threads used by load_multiple_files_in_path
+_MAX_LOAD_WORKERS = 32
+
+# Tokens that change the scanner state: comment openers, string delimiters and statement ends
+_SQL_TOKEN = re.compile(r"--|/\*|['\";]")
+
 
 def file_exists_in_path(file_path: str | Path) -> bool:
     """
@@ -60,11 +78,10 @@ def load_json_file_in_path(file_path: str | Path) -> dict[str, any]:
     if not path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with path.open("r", encoding="utf-8") as file:
-        try:
-            return json.load(file)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON file: {file_path}") from e
+    try:
+        return load_json_data(path.read_bytes())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON file: {file_path}") from e
 
 
 def load_yaml_file_in_path(file_path: str | Path) -> dict[str, Any]:
@@ -96,33 +113,92 @@ def load_yaml_file_in_path(file_path: str | Path) -> dict[str, Any]:
     if not path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with path.open("r", encoding="utf-8") as file:
-        try:
-            return yaml.safe_load(file)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML file: {file_path}") from e
+    try:
+        return yaml.load(path.read_bytes(), Loader=_YamlSafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML file: {file_path}") from e
 
 
-def load_multiline_sql_file_in_path(sql_content):
-    # Remove SQL single-line comments (-- comment)
-    sql_content = re.sub(r"--.*", "", sql_content)
+def _flush_sql_statement(buffer: list[str], statements: list[str]) -> None:
+    # Collapse whitespace and keep the statement only if something is left
+    statement = " ".join("".join(buffer).split())
+    if statement:
+        statements.append(statement)
+    buffer.clear()
+
+
+def _clean_sql(text: str) -> list[str]:
+    """
+    Strip comments from SQL text and split it into statements in a single pass
+
+    Comment markers and semicolons inside quoted strings or identifiers are kept as-is
+
+    Args:
+        text (str): Raw SQL text
+
+    Returns:
+        list[str]: Statements with comments removed and whitespace collapsed
+    """
+    statements = []
+    buffer = []
+    position = 0
+    length = len(text)
+
+    while position < length:
+        match = _SQL_TOKEN.search(text, position)
+        if match is None:
+            buffer.append(text[position:])
+            break
+
+        start = match.start()
+        token = match.group()
+        buffer.append(text[position:start])
+
+        if token == ";":
+            _flush_sql_statement(buffer, statements)
+            position = start + 1
+        elif token == "--":
+            end = text.find("\n", start + 2)
+            position = length if end == -1 else end
+        elif token == "/*":
+            end = text.find("*/", start + 2)
+            buffer.append(" ")
+            position = length if end == -1 else end + 2
+        else:
+            # Quoted string or identifier; a doubled quote simply closes and reopens it
+            end = text.find(token, start + 1)
+            position = length if end == -1 else end + 1
+            buffer.append(text[start:position])
+
+    _flush_sql_statement(buffer, statements)
+    return statements
 
-    # Remove SQL multi-line comments (/* comment */)
-    sql_content = re.sub(r"/\*.*?\*/", "", sql_content, flags=re.DOTALL)
 
-    # Normalize whitespace (remove excess spaces and new lines)
-    sql_content = re.sub(r"\s+", " ", sql_content).strip()
+def load_multiline_sql_file_in_path(sql_content):
+    # Remove comments, normalize whitespace and split into statements
+    return _clean_sql(sql_content)
 
-    # Split SQL statements correctly (handles newlines & multiple statements)
-    sql_statements = [stmt.strip() for stmt in sql_content.split(";") if stmt.strip()]
 
-    return sql_statements
+@lru_cache(maxsize=_FILE_CACHE_MAX_SIZE)
+def _load_file_cached(resolved_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns and size are only part of the cache key, a changed file misses and is parsed again
+    path = Path(resolved_path)
+    match path.suffix.lower():
+        case ".json":
+            return load_json_file_in_path(path)
+        case ".yaml" | ".yml":
+            return load_yaml_file_in_path(path)
+        case _:
+            raise ValueError(f"Unsupported file type: {path.suffix}")
 
 
 def load_file_in_path(file_path: str | Path) -> dict[str, Any]:
     """
     Load a file (JSON or YAML) from the given path and return the data as a dictionary
 
+    Parsed results are cached until the file's modification time or size changes, so repeated loads of the same
+    file return the same object. Treat the result as read-only and copy it before mutating
+
     Args:
         file_path (str | Path): Path to the file
 
@@ -148,13 +224,47 @@ def load_file_in_path(file_path: str | Path) -> dict[str, Any]:
     if not path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    match path.suffix.lower():
-        case ".json":
-            return load_json_file_in_path(path)
-        case ".yaml" | ".yml":
-            return load_yaml_file_in_path(path)
-        case _:
-            raise ValueError(f"Unsupported file type: {path.suffix}")
+    stat = path.stat()
+    return _load_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=_FILE_CACHE_MAX_SIZE)
+def _load_json_file_cached(resolved_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # Same keying as _load_file_cached, but always parsed as JSON whatever the file extension
+    return load_json_file_in_path(resolved_path)
+
+
+def load_cached_json_file_in_path(file_path: str | Path) -> dict[str, Any]:
+    """
+    Load a JSON file from the given path, parsing it again only when its modification time or size changes
+
+    Unlike load_file_in_path the content is parsed as JSON regardless of the file extension. Repeated loads of the
+    same file return the same object, treat the result as read-only and copy it before mutating
+
+    Args:
+        file_path (str | Path): Path to the JSON file
+
+    Returns:
+        dict[str, Any]: Data loaded from the JSON file
+
+    Raises:
+        TypeError: If the input is not a string or Path object
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file cannot be parsed as JSON
+
+    Examples:
+        >>> load_cached_json_file_in_path("settings.toml")
+        {'key': 'value'}
+    """
+    if not isinstance(file_path, (str, Path)):
+        raise TypeError("file_path must be a string or Path object")
+
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    stat = path.stat()
+    return _load_json_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
 def load_multiple_files_in_path(file_paths: list[str | Path]) -> list[dict[str, Any]]:
@@ -179,4 +289,9 @@ def load_multiple_files_in_path(file_paths: list[str | Path]) -> list[dict[str,
     if not isinstance(file_paths, list) or any(not isinstance(fp, (str, Path)) for fp in file_paths):
         raise TypeError("file_paths must be a list of strings or Path objects")
 
-    return [load_file_in_path(file_path) for file_path in file_paths]
+    if len(file_paths) <= 1:
+        return [load_file_in_path(file_path) for file_path in file_paths]
+
+    # Overlap the disk reads; map keeps the input order and re-raises the first failure
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(file_paths))) as executor:
+        return list(executor.map(load_file_in_path, file_paths))
@@ -2,11 +2,31 @@ import base64
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_GITHUB_URL_RE = re.compile(r"https://github.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)")
+
+# GitHub caps how many nodes a single GraphQL query may request, batch file lookups below that
+_GRAPHQL_BATCH_SIZE = 100
+
+# Shared session so repeated fetches reuse pooled keep-alive connections to GitHub.
+# Rate-limit and transient server errors are retried with backoff; once retries run out
+# the last response is returned so callers still see GitHub's status and message
+_GH_SESSION = requests.Session()
+_GH_SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+_GH_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3, backoff_factor=0.5, status_forcelist=(403, 429, 500, 502, 503, 504), raise_on_status=False
+    )
+))
 
 
 def parse_github_url(file_url):
 
-    match = re.match(r"https://github.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)", file_url)
+    match = _GITHUB_URL_RE.match(file_url)
     if not match:
         raise ValueError("Invalid GitHub URL format")
 
@@ -17,13 +37,22 @@ def parse_github_url(file_url):
 def fetch_file_content(repo_owner, repo_name, file_path, branch, pat, run_mode):
 
     url_path_starter = 'https:'
-    api_url = f"{url_path_starter}//api.github.com/repos/{repo_owner}/{repo_name}/contents/{file_path}?ref={branch}"
-
-    headers = {"Authorization": f"token {pat}", "Accept": "application/vnd.github.v3+json"}
+    headers = {"Authorization": f"token {pat}"}
 
     verify = True if run_mode != 'local' else False
 
-    response = requests.get(api_url, headers=headers, verify=verify)
+    # The raw endpoint returns the file bytes directly, no JSON envelope or base64 to decode
+    raw_url = f"{url_path_starter}//raw.githubusercontent.com/{repo_owner}/{repo_name}/{branch}/{file_path}"
+    response = _GH_SESSION.get(raw_url, headers=headers, verify=verify)
+
+    if response.status_code == 200:
+        return response.content.decode("utf-8")
+    if response.status_code != 404:
+        raise Exception(f"Error fetching file: {response.status_code} - {response.text or 'Unknown error'}")
+
+    # Fall back to the Contents API, which also resolves refs the raw endpoint does not
+    api_url = f"{url_path_starter}//api.github.com/repos/{repo_owner}/{repo_name}/contents/{file_path}?ref={branch}"
+    response = _GH_SESSION.get(api_url, headers=headers, verify=verify)
 
     if response.status_code == 200:
         file_content = base64.b64decode(response.json()["content"]).decode("utf-8")
@@ -31,3 +60,64 @@ def fetch_file_content(repo_owner, repo_name, file_path, branch, pat, run_mode):
     else:
         error_message = response.json().get("message", "Unknown error")
         raise Exception(f"Error fetching file: {response.status_code} - {error_message}")
+
+
+def _build_files_query(refs):
+    # One aliased repository lookup per file, all values passed as variables so nothing is spliced into the query
+    declarations = []
+    selections = []
+    variables = {}
+    for index, (repo_owner, repo_name, branch, file_path) in enumerate(refs):
+        declarations.append(f"$o{index}: String!, $n{index}: String!, $e{index}: String!")
+        selections.append(
+            f"f{index}: repository(owner: $o{index}, name: $n{index}) "
+            f"{{ object(expression: $e{index}) {{ ... on Blob {{ text isTruncated isBinary }} }} }}"
+        )
+        variables.update({f"o{index}": repo_owner, f"n{index}": repo_name, f"e{index}": f"{branch}:{file_path}"})
+
+    query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+    return query, variables
+
+
+def fetch_files_content(refs, pat, run_mode):
+    """
+    Fetches several files in as few round-trips as possible using the GitHub GraphQL API.
+    refs is a list of (repo_owner, repo_name, branch, file_path) tuples, contents are returned in the same order.
+    """
+    url_path_starter = 'https:'
+    graphql_url = f"{url_path_starter}//api.github.com/graphql"
+    headers = {"Authorization": f"token {pat}"}
+
+    verify = True if run_mode != 'local' else False
+
+    contents = []
+    for start in range(0, len(refs), _GRAPHQL_BATCH_SIZE):
+        batch = refs[start:start + _GRAPHQL_BATCH_SIZE]
+        query, variables = _build_files_query(batch)
+
+        response = _GH_SESSION.post(graphql_url, json={"query": query, "variables": variables},
+                                    headers=headers, verify=verify)
+
+        # Check the status before decoding, proxies and 5xx pages answer with HTML rather than JSON
+        if response.status_code != 200:
+            raise Exception(f"Error fetching files: {response.status_code} - {response.text or 'Unknown error'}")
+
+        payload = response.json()
+        if payload.get("errors"):
+            error_message = "; ".join(error.get("message", "Unknown error") for error in payload["errors"])
+            raise Exception(f"Error fetching files: {response.status_code} - {error_message}")
+
+        data = payload["data"]
+        for index, (repo_owner, repo_name, branch, file_path) in enumerate(batch):
+            blob = (data.get(f"f{index}") or {}).get("object")
+            if not blob:
+                raise Exception(f"Error fetching file: {repo_owner}/{repo_name}/{branch}/{file_path} not found")
+            if blob.get("isBinary"):
+                raise Exception(f"Error fetching file: {repo_owner}/{repo_name}/{branch}/{file_path} is binary")
+            if blob.get("isTruncated") or blob.get("text") is None:
+                # GraphQL cuts off large blobs, read those in full from the raw endpoint
+                contents.append(fetch_file_content(repo_owner, repo_name, file_path, branch, pat, run_mode))
+            else:
+                contents.append(blob["text"])
+
+    return contents
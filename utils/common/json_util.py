@@ -1,6 +1,46 @@
 import json
+import re
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library parser
+    orjson = None
+
+# orjson turns integers outside the 64-bit range into floats; any run of 20+ digits is left to the standard library
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"\d{20}")
+_LONG_DIGIT_RUN_STR = re.compile(r"\d{20}")
+
+
+def load_json_data(content: bytes | str) -> Any:
+    """
+    Parse JSON content into a Python data structure, using orjson when it is installed
+
+    The result is always the same as json.loads: documents orjson rejects (NaN, Infinity, out of range numbers) or
+    would parse differently (integers beyond 64 bits) are handed to the standard library instead
+
+    Args:
+        content (bytes | str): Raw JSON document, UTF-8 bytes are parsed without decoding to str first
+
+    Returns:
+        Any: Parsed data structure
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+
+    Examples:
+        >>> load_json_data(b'{"key": "value"}')
+        {'key': 'value'}
+    """
+    if orjson is not None:
+        long_digit_run = _LONG_DIGIT_RUN_BYTES if isinstance(content, bytes) else _LONG_DIGIT_RUN_STR
+        if isinstance(content, (bytes, str)) and not long_digit_run.search(content):
+            try:
+                return orjson.loads(content)
+            except (orjson.JSONDecodeError, TypeError):
+                pass
+    return json.loads(content)
+
 
 def dump_json_data(data: Any, indent: int) -> str:
     """
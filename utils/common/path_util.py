@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -23,9 +24,14 @@ def construct_path(*args: str | Path) -> Path:
     """
     if not args:
         raise ValueError("At least one path component must be provided")
-    if any(not isinstance(arg, (str, Path)) for arg in args):
-        raise TypeError("All arguments must be strings or Path objects")
-    return Path(*map(str, args))
+
+    # Validate and convert in one pass, then let Path parse the joined string once
+    parts = []
+    for arg in args:
+        if not isinstance(arg, (str, Path)):
+            raise TypeError("All arguments must be strings or Path objects")
+        parts.append(os.fspath(arg))
+    return Path(os.path.join(*parts))
 
 
 def convert_underscore_to_nested_path(value: str | Path) -> Path:
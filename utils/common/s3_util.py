@@ -1,10 +1,23 @@
+import codecs
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tempfile import SpooledTemporaryFile
+
 from botocore.exceptions import ClientError
-from chardet import detect
+from chardet.universaldetector import UniversalDetector
 
 from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
 
+# S3 rejects DeleteObjects requests with more than 1000 keys
+S3_DELETE_BATCH_SIZE = 1000
+S3_DELETE_MAX_WORKERS = 16
+S3_CONVERT_MAX_WORKERS = 32
+
+# Read size for streamed downloads, and how much converted output stays in memory before spilling to disk
+S3_STREAM_CHUNK_BYTES = 64 * 1024
+S3_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 
 def get_s3_uri_with_bucket_prefix(bucket_name, uri):
     s3_path_starter = 's3:'
@@ -17,7 +30,8 @@ def check_s3_files_exist(s3_client, bucket_name, uri):
     Checks if any files exist in the given S3 path.
     Returns True if files are found, otherwise False.
     """
-    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=uri)
+    # One key is enough to answer the question, don't let S3 list a full page
+    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=uri, MaxKeys=1)
     return 'Contents' in response
 
 
@@ -33,34 +47,91 @@ def list_recoverable_s3_file_versions(s3_client, bucket_name, uri):
 
 
 def count_s3_files(s3_client, bucket_name, uri):
-    total_files = 0
-    continuation_token = None
+    # Every list_objects_v2 page reports its own KeyCount, no need to materialise Contents
+    paginator = s3_client.get_paginator('list_objects_v2')
+    return sum(paginator.paginate(Bucket=bucket_name, Prefix=uri).search('KeyCount'))
 
-    while True:
-        list_kwargs = {'Bucket': bucket_name, 'Prefix': uri}
-        if continuation_token:
-            list_kwargs['ContinuationToken'] = continuation_token
 
-        response = s3_client.list_objects_v2(**list_kwargs)
+def delete_s3_files(s3_client, bucket_name, uri):
+    """
+    Deletes every object under the given S3 prefix, in batches of up to 1000 keys.
+    Returns the number of objects deleted.
+    """
+    paginator = s3_client.get_paginator('list_objects_v2')
+    keys = [
+        obj['Key']
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=uri)
+        for obj in page.get('Contents', [])
+    ]
+
+    if not keys:
+        return 0
+
+    batches = [keys[i:i + S3_DELETE_BATCH_SIZE] for i in range(0, len(keys), S3_DELETE_BATCH_SIZE)]
+
+    def delete_batch(batch):
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+        )
+        errors = response.get('Errors', [])
+        for error in errors:
+            LOGGER.error(f"Failed to delete {bucket_name}/{error.get('Key')}: {error.get('Message')}")
+        return len(batch) - len(errors)
+
+    with ThreadPoolExecutor(max_workers=min(S3_DELETE_MAX_WORKERS, len(batches))) as executor:
+        return sum(executor.map(delete_batch, batches))
+
+
+def _detect_s3_file_encoding(s3_client, s3_bucket, file_key):
+    # Feed the detector chunk by chunk and stop reading as soon as it is confident
+    detector = UniversalDetector()
+    body = s3_client.get_object(Bucket=s3_bucket, Key=file_key)['Body']
+    try:
+        for chunk in iter(lambda: body.read(S3_STREAM_CHUNK_BYTES), b''):
+            detector.feed(chunk)
+            if detector.done:
+                break
+    finally:
+        body.close()
+    return detector.close()['encoding']
 
-        if 'Contents' in response:
-            total_files += len(response['Contents'])
 
-        if response.get('IsTruncated'):
-            continuation_token = response['NextContinuationToken']
-        else:
-            break
+def _convert_s3_file_to_utf8(s3_client, s3_bucket, file_key, source_encoding):
+    """
+    Re-encodes a single S3 object from source_encoding to UTF-8 in place, streaming it through a spooled
+    temporary file so large objects are never held in memory whole.
+    Returns True if the object was rewritten, False if it was already UTF-8.
+    """
+    # Decoding UTF-8 and re-encoding it is a no-op, don't download the file at all
+    if codecs.lookup(source_encoding).name == 'utf-8':
+        LOGGER.info(f'Source encoding is already UTF-8 - {s3_bucket}/{file_key}')
+        return False
 
-    return total_files
+    detected_encoding = _detect_s3_file_encoding(s3_client, s3_bucket, file_key)
 
+    # Check if the file is already in UTF-8
+    if detected_encoding and detected_encoding.lower() == 'utf-8':
+        LOGGER.info(f'File is already in UTF-8 - {s3_bucket}/{file_key}')
+        return False
 
-def delete_s3_files(s3_client, bucket_name, uri):
-    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=uri)
+    # The incremental decoder carries multi-byte sequences that straddle chunk boundaries
+    decoder = codecs.getincrementaldecoder(source_encoding)()
+    body = s3_client.get_object(Bucket=s3_bucket, Key=file_key)['Body']
+    with SpooledTemporaryFile(max_size=S3_SPOOL_MAX_BYTES) as utf8_file:
+        try:
+            for chunk in iter(lambda: body.read(S3_STREAM_CHUNK_BYTES), b''):
+                utf8_file.write(decoder.decode(chunk).encode('utf-8'))
+            utf8_file.write(decoder.decode(b'', final=True).encode('utf-8'))
+        finally:
+            body.close()
+        utf8_file.seek(0)
+
+        # Upload the converted file back to S3
+        s3_client.upload_fileobj(utf8_file, s3_bucket, file_key)
 
-    if 'Contents' in response:
-        objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
-        s3_client.delete_objects(Bucket=bucket_name, Delete={'Objects': objects_to_delete})
-        return len(objects_to_delete)
+    LOGGER.info(f"Converted and uploaded - {s3_bucket}/{file_key}")
+    return True
 
 
 def convert_s3_files_to_utf8(s3_client, s3_bucket, s3_prefix, source_encoding, source_file_type):
@@ -68,55 +139,38 @@ def convert_s3_files_to_utf8(s3_client, s3_bucket, s3_prefix, source_encoding, s
     paginator = s3_client.get_paginator('list_objects_v2')
     page_iterator = paginator.paginate(Bucket=s3_bucket, Prefix=s3_prefix)
 
-    for page in page_iterator:
-        if 'Contents' not in page:
-            LOGGER.info(f'No files found in - {s3_bucket}/{s3_prefix}')
-            return
-
-        for obj in page['Contents']:
-            # Get the object key (file path)
-            file_key = obj['Key']
-
-            # Skip if it's a directory
-            if file_key.endswith('/'):
-                continue
-
-            # Skip if the file does not match the specified file type
-            if not file_key.lower().endswith(f".{source_file_type.lower()}"):
-                LOGGER.info(f"Skipping non-{source_file_type} - {s3_bucket}/{file_key}")
-                continue
-
-            LOGGER.info(f"Processing file: {s3_bucket}/{file_key}")
+    # Each conversion is a few latency-bound S3 round-trips, so overlap them; boto3 clients are thread-safe
+    with ThreadPoolExecutor(max_workers=S3_CONVERT_MAX_WORKERS) as executor:
+        futures = {}
 
-            try:
-                # Download the file into memory
-                response = s3_client.get_object(Bucket=s3_bucket, Key=file_key)
-                file_content = response['Body'].read()
+        for page in page_iterator:
+            if 'Contents' not in page:
+                LOGGER.info(f'No files found in - {s3_bucket}/{s3_prefix}')
+                break
 
-                # Detect the file's encoding
-                detected_encoding = detect(file_content)['encoding']
+            for obj in page['Contents']:
+                # Get the object key (file path)
+                file_key = obj['Key']
 
-                # Check if the file is already in UTF-8
-                if detected_encoding.lower() == 'utf-8':
-                    LOGGER.info(f'File is already in UTF-8 - {s3_bucket}/{file_key}')
+                # Skip if it's a directory
+                if file_key.endswith('/'):
                     continue
 
-                # Decode the file content from the source encoding
-                decoded_content = file_content.decode(source_encoding)
-
-                # Encode the content to UTF-8
-                utf8_content = decoded_content.encode('utf-8')
+                # Skip if the file does not match the specified file type
+                if not file_key.lower().endswith(f".{source_file_type.lower()}"):
+                    LOGGER.info(f"Skipping non-{source_file_type} - {s3_bucket}/{file_key}")
+                    continue
 
-                # Upload the converted file back to S3
-                s3_client.put_object(
-                    Bucket=s3_bucket,
-                    Key=file_key,
-                    Body=utf8_content
-                )
+                LOGGER.info(f"Processing file: {s3_bucket}/{file_key}")
+                future = executor.submit(_convert_s3_file_to_utf8, s3_client, s3_bucket, file_key, source_encoding)
+                futures[future] = file_key
 
-                LOGGER.info(f"Converted and uploaded - {s3_bucket}/{file_key}")
+        # A failed file is logged and does not abort the rest of the batch
+        for future in as_completed(futures):
+            try:
+                future.result()
             except Exception as e:
-                LOGGER.info(f"Error processing file {file_key}: {e}")
+                LOGGER.info(f"Error processing file {futures[future]}: {e}")
 
     LOGGER.info("All files processed.")
 
@@ -125,11 +179,17 @@ def recover_latest_s3_files(s3_client, bucket_name, prefix):
     try:
         LOGGER.info(f"Checking versions for files in {bucket_name}/{prefix}")
 
-        # List versions including delete markers
-        response = s3_client.list_object_versions(Bucket=bucket_name, Prefix=prefix)
+        # List versions including delete markers, keeping only the newest version of each key
+        paginator = s3_client.get_paginator('list_object_versions')
+        latest_versions = {}
+        delete_markers = []
 
-        versions = response.get('Versions', [])
-        delete_markers = response.get('DeleteMarkers', [])
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            delete_markers.extend(page.get('DeleteMarkers', []))
+            for version in page.get('Versions', []):
+                current = latest_versions.get(version['Key'])
+                if current is None or version['LastModified'] > current['LastModified']:
+                    latest_versions[version['Key']] = version
 
         if not delete_markers:
             LOGGER.warning(f"No delete markers found in {bucket_name}/{prefix}")
@@ -161,12 +221,7 @@ def recover_latest_s3_files(s3_client, bucket_name, prefix):
             LOGGER.info(f"Delete marker removed for {key}. File restored.")
 
             # Find the latest version corresponding to the deleted key
-            latest_version = max(
-                [v for v in versions if v['Key'] == key],
-                key=lambda v: v['LastModified']
-            )
-
-            recovered_files.append(latest_version)
+            recovered_files.append(latest_versions[key])
 
         return recovered_files
 
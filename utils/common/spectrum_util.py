@@ -1,24 +1,31 @@
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from utils.common.sqlalchemy_util import run_sql_query
+from utils.common.sqlalchemy_util import run_sql_query, validate_sql_identifier
 from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
 
+SPECTRUM_SCHEMA_EXISTS_QUERY = text(
+    "SELECT schemaname FROM svv_external_schemas WHERE schemaname = :schema_name AND databasename = :database_name"
+)
+
 
 def create_spectrum_schema_in_wh_if_not_exists(wh_client, spectrum_schema, external_db_name):
+    validate_sql_identifier(spectrum_schema)
     try:
         # Check if schema exists
-        query = f"SELECT schemaname FROM svv_external_schemas WHERE schemaname = '{spectrum_schema}' " \
-                f"AND databasename = '{external_db_name}';"
-        result = wh_client.execute(query).fetchone()
+        result = wh_client.execute(SPECTRUM_SCHEMA_EXISTS_QUERY.bindparams(
+            schema_name=spectrum_schema, database_name=external_db_name
+        )).fetchone()
 
         if not result:
-            # Create external schema
+            # Create external schema, the database name is a string literal so escape embedded quotes
+            escaped_db_name = external_db_name.replace("'", "''")
             create_schema_query = f"""
             CREATE EXTERNAL SCHEMA IF NOT EXISTS {spectrum_schema}
             FROM DATA CATALOG
-            DATABASE '{external_db_name}'
+            DATABASE '{escaped_db_name}'
             IAM_ROLE default;
             """
             wh_client.execute(create_schema_query)
@@ -78,6 +85,9 @@ def create_external_table(
         # Log the test_columns to verify its structure before generating the column definitions
         LOGGER.info(f"test_columns: {test_columns}")
 
+        # The table name is interpolated into the DDL, only accept plain (optionally schema-qualified) names
+        validate_sql_identifier(table_name, allow_qualified=True)
+
         # Ensure test_columns is a list of strings, each representing a column definition
         if not isinstance(test_columns, list):
             raise ValueError(f"test_columns should be a list, but got {type(test_columns)}")
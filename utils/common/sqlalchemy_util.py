@@ -1,10 +1,34 @@
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
 
+from utils.framework.custom_logger_util import get_logger
+
+LOGGER = get_logger()
+
+# Matches identifiers preceded by whitespace that start with digits and an underscore
+_QUOTE_COLUMN_RE = re.compile(r'(?<=\s)(\d+_\w+)')
+
+# Plain, unquoted SQL identifier; anything else is rejected before being interpolated into DDL
+_SQL_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Config key prefix per database type, used to build the engine cache key
+_DB_CONFIG_PREFIXES = {'aws_redshift': 'redshift', 'aws_aurora': 'aurora', 'snowflake': 'snowflake'}
+
+# Upper bound on cached engines, the least recently used one is disposed when another is added
+_ENGINE_CACHE_MAX_SIZE = 16
+
+# Engine cache key -> (full config the engine was built from, engine), least recently used first.
+# The config is kept out of the key so passwords never become part of it, but is compared on every lookup
+_ENGINE_CONFIGS: OrderedDict[tuple, tuple[dict[str, str], Engine]] = OrderedDict()
+_ENGINE_LOCK = threading.Lock()
+
 
 def create_sqlalchemy_url(db_name: str, db_config: dict[str, str]) -> URL:
     """
@@ -62,6 +86,99 @@ def create_sqlalchemy_url(db_name: str, db_config: dict[str, str]) -> URL:
         raise ValueError(f"Unsupported database name: {db_name}")
 
 
+def _engine_cache_key(db_name: str, db_config: dict[str, str]) -> tuple:
+    prefix = _DB_CONFIG_PREFIXES.get(db_name)
+    if prefix is None:
+        raise ValueError(f"Unsupported database name: {db_name}")
+    return (
+        db_name,
+        db_config[f'{prefix}_host'],
+        db_config.get(f'{prefix}_port'),
+        db_config[f'{prefix}_database'],
+        db_config[f'{prefix}_username'],
+    )
+
+
+def _create_engine(db_name: str, db_config: dict[str, str]) -> Engine:
+    return create_engine(
+        create_sqlalchemy_url(db_name, db_config),
+        connect_args={'sslmode': 'allow'},
+        isolation_level="AUTOCOMMIT",
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+
+def get_engine(db_name: str, db_config: dict[str, str]) -> Engine:
+    """
+    Returns a shared SQLAlchemy engine for the given database, creating it on first use
+
+    Engines are cached by database type, host, port, database and username, so every caller targeting the same
+    database reuses one connection pool. When the rest of the config changes, e.g. a rotated password, the old
+    engine is disposed and rebuilt. Stale pooled connections are detected with a pre-ping and recycled after
+    30 minutes
+
+    Args:
+        db_name (str): The name of the database type ('aws_redshift', 'aws_aurora', or 'snowflake')
+        db_config (dict[str, str]): A dictionary containing database connection details
+
+    Returns:
+        Engine: A SQLAlchemy engine for the database
+
+    Raises:
+        ValueError: If the database type is unsupported
+
+    Examples:
+        >>> engine = get_engine("aws_aurora", sample_db_config)
+        >>> engine is get_engine("aws_aurora", sample_db_config)
+        True
+    """
+    key = _engine_cache_key(db_name, db_config)
+
+    with _ENGINE_LOCK:
+        cached = _ENGINE_CONFIGS.get(key)
+        if cached is not None and cached[0] == db_config:
+            _ENGINE_CONFIGS.move_to_end(key)
+            return cached[1]
+
+        if cached is not None:
+            # Same database and user but new credentials or options, drop the pool built from the old ones
+            cached[1].dispose()
+
+        engine = _create_engine(db_name, db_config)
+        _ENGINE_CONFIGS[key] = (dict(db_config), engine)
+        _ENGINE_CONFIGS.move_to_end(key)
+
+        while len(_ENGINE_CONFIGS) > _ENGINE_CACHE_MAX_SIZE:
+            _, (_, evicted_engine) = _ENGINE_CONFIGS.popitem(last=False)
+            evicted_engine.dispose()
+
+        return engine
+
+
+def _iter_query_rows(db_engine: Engine, query: str, batch_size: int | None) -> Iterator[dict[str, any]]:
+    try:
+        query = process_query_columns(query)
+        with db_engine.connect() as connection:
+            if batch_size and db_engine.dialect.supports_server_side_cursors:
+                # Server-side cursors need a transaction, so step out of the engine's AUTOCOMMIT for this connection
+                connection = connection.execution_options(
+                    stream_results=True, isolation_level=connection.default_isolation_level
+                )
+                result = connection.execute(query).yield_per(batch_size)
+            else:
+                if batch_size:
+                    LOGGER.warning(
+                        f"{db_engine.dialect.name}+{db_engine.dialect.driver} has no server-side cursors, "
+                        f"the driver buffers the whole query result in memory"
+                    )
+                result = connection.execute(query)
+            for row in result.mappings():
+                yield dict(row)
+    except SQLAlchemyError as e:
+        raise RuntimeError(f"Failed to execute query: {query}") from e
+
+
 def read_sql_query(db_engine: Engine, query: str) -> list[dict[str, any]]:
     """
     Executes a SQL query using the provided SQLAlchemy engine and returns the result as a list of dictionaries
@@ -81,15 +198,35 @@ def read_sql_query(db_engine: Engine, query: str) -> list[dict[str, any]]:
         >>> read_sql_query(engine, "SELECT 1 AS value")
         [{'value': 1}]
     """
-    try:
-        query = process_query_columns(query)
-        with db_engine.connect() as connection:
-            result = connection.execute(query)
-            rows = result.fetchall()
-            columns = result.keys()
-            return [dict(zip(columns, row)) for row in rows]
-    except SQLAlchemyError as e:
-        raise RuntimeError(f"Failed to execute query: {query}") from e
+    return list(_iter_query_rows(db_engine, query, batch_size=None))
+
+
+def iter_sql_query(db_engine: Engine, query: str, batch_size: int = 10_000) -> Iterator[dict[str, any]]:
+    """
+    Executes a SQL query and yields the result rows as dictionaries without buffering the whole result
+
+    Rows are fetched in batches through a server-side cursor where the dialect supports one (PostgreSQL via
+    psycopg2, i.e. Aurora), so memory stays bounded by the batch size. Other dialects, including Redshift through
+    redshift_connector, cannot stream: the driver buffers the whole result and a warning is logged. The connection
+    is held open until the iterator is exhausted or closed
+
+    Args:
+        db_engine (Engine): SQLAlchemy engine to use for the database connection
+        query (str): SQL query to execute
+        batch_size (int): Number of rows fetched from the database per round-trip
+
+    Returns:
+        Iterator[dict[str, any]]: Iterator over the query results
+
+    Raises:
+        RuntimeError: If the query execution fails
+
+    Examples:
+        >>> engine = create_engine("sqlite:///:memory:")
+        >>> list(iter_sql_query(engine, "SELECT 1 AS value"))
+        [{'value': 1}]
+    """
+    return _iter_query_rows(db_engine, query, batch_size=batch_size)
 
 
 def run_sql_query(db_engine: Engine, query: str) -> None:
@@ -125,10 +262,37 @@ def process_query_columns(query: str) -> str:
     - 'SELECT blah blah from 2_colname numeric(31, 8)' becomes:
       'SELECT blah blah from "2_colname" numeric(31, 8)'
     """
-    # This regex looks for a whitespace character
-    # immediately followed by one or more digits, an underscore, and one or more word characters
-    pattern = r'(?<=\s)(\d+_\w+)'
+    # Every match contains an underscore, most queries have none and can skip the regex entirely
+    if '_' not in query:
+        return query
 
     # The replacement wraps the captured group in double quotes.
-    processed_query = re.sub(pattern, r'"\1"', query)
+    processed_query = _QUOTE_COLUMN_RE.sub(r'"\1"', query)
     return processed_query
+
+
+def validate_sql_identifier(name: str, allow_qualified: bool = False) -> str:
+    """
+    Validates that a name is a plain SQL identifier so it can be safely interpolated into a statement
+
+    Args:
+        name (str): Identifier to validate, e.g. a schema or table name
+        allow_qualified (bool): Accept dot-separated names such as 'schema.table'
+
+    Returns:
+        str: The validated identifier, unchanged
+
+    Raises:
+        ValueError: If the name is not a string or contains anything other than letters, digits and underscores
+
+    Examples:
+        >>> validate_sql_identifier("spectrum_schema")
+        'spectrum_schema'
+
+        >>> validate_sql_identifier("spectrum_schema.customer", allow_qualified=True)
+        'spectrum_schema.customer'
+    """
+    parts = name.split(".") if allow_qualified and isinstance(name, str) else [name]
+    if not all(isinstance(part, str) and _SQL_IDENTIFIER_RE.fullmatch(part) for part in parts):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
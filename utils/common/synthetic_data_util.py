@@ -1,17 +1,47 @@
+import csv
+import io
+import random
 import re
 import secrets
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from decimal import Decimal
+from decimal import Context, Decimal
+from functools import lru_cache
+from itertools import islice
 
+import numpy as np
 import sqlalchemy
 from faker import Faker
 from sqlalchemy import MetaData, Table, delete, insert
+from sqlalchemy.sql.dml import Insert
 
 from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
 
-fake = Faker()
+_VARCHAR_RE = re.compile(r"VARCHAR\((\d+)\)", re.IGNORECASE)
+_NUMERIC_RE = re.compile(r"NUMERIC\((\d+),\s*(\d+)\)", re.IGNORECASE)
+
+# Rows per executemany call when inserting synthetic data, unless the dialect has a better fit below
+INSERT_BATCH_SIZE = 1000
+
+# Dialects whose insert throughput peaks at a different batch size
+_BATCH_SIZE_BY_DIALECT = {"postgresql": 1000, "mysql": 10000, "sqlite": 500, "duckdb": 50000}
+
+# SQL Server rejects statements with more than 2100 bound parameters
+_MSSQL_MAX_PARAMETERS = 2100
+
+# NULL marker used in COPY payloads, distinct from the empty string
+_COPY_NULL = "\\N"
+
+# Non-cryptographic generator for fake data that NumPy can't produce directly
+_RNG = random.Random()
+
+# Wide enough for any NUMERIC(38, s) value, so scaling never rounds
+_DECIMAL_CONTEXT = Context(prec=64)
+
+# Number of Faker words and dates sampled up front and then drawn from when generating rows
+VALUE_POOL_SIZE = 4096
 
 
 def generate_table_schema_from_columns(expected_columns: list) -> dict:
@@ -29,6 +59,12 @@ def generate_table_schema_from_columns(expected_columns: list) -> dict:
               - float: ["float", precision - scale + 0.1]
               - decimal: ["decimal", (precision, scale)]
     """
+    # Parsing is memoized per column list; hand out a copy so callers can extend the schema freely
+    return {col: list(spec) for col, spec in _parse_table_schema(tuple(expected_columns)).items()}
+
+
+@lru_cache(maxsize=256)
+def _parse_table_schema(expected_columns: tuple[str, ...]) -> dict:
     table_schema = {}
 
     for col_def in expected_columns:
@@ -37,14 +73,15 @@ def generate_table_schema_from_columns(expected_columns: list) -> dict:
             continue
 
         col_name, col_type = parts[0], parts[1]
+        upper_type = col_type.upper()
 
-        if "VARCHAR" in col_type.upper():
-            match = re.search(r"VARCHAR\((\d+)\)", col_type, re.IGNORECASE)
+        if "VARCHAR" in upper_type:
+            match = _VARCHAR_RE.search(col_type)
             length = int(match.group(1)) if match else 255
             table_schema[col_name] = ["str", length]
 
-        elif "NUMERIC" in col_type.upper():
-            match = re.search(r"NUMERIC\((\d+),\s*(\d+)\)", col_type, re.IGNORECASE)
+        elif "NUMERIC" in upper_type:
+            match = _NUMERIC_RE.search(col_type)
             if match:
                 precision = int(match.group(1))
                 scale = int(match.group(2))
@@ -52,19 +89,19 @@ def generate_table_schema_from_columns(expected_columns: list) -> dict:
             else:
                 table_schema[col_name] = ["decimal", (10, 2)]  # Default precision and scale
 
-        elif "INT" in col_type.upper():
+        elif "INT" in upper_type:
             table_schema[col_name] = ["int", 10]
 
-        elif "DATE" in col_type.upper():
+        elif "DATE" in upper_type:
             table_schema[col_name] = ["date", None]
 
-        elif "TIMESTAMP" in col_type.upper():
+        elif "TIMESTAMP" in upper_type:
             table_schema[col_name] = ["timestamp", None]
 
-        elif "BOOLEAN" in col_type.upper():
+        elif "BOOLEAN" in upper_type:
             table_schema[col_name] = ["boolean", None]
 
-        elif "REAL" in col_type.upper() or "FLOAT" in col_type.upper():
+        elif "REAL" in upper_type or "FLOAT" in upper_type:
             table_schema[col_name] = ["float", 10.1]
 
         else:
@@ -90,84 +127,243 @@ def ensure_src_sys_cd_column(table_schema: dict) -> dict:
     return table_schema
 
 
-def generate_synthetic_data(table_schema: dict, num_rows: int) -> list:
+def _generate_src_sys_cd(limit):
+    return "XYZ"
+
+
+def _generate_co_nbr(limit):
+    return str(secrets.choice(range(1, 201)))  # Random int as str (1-200)
+
+
+def _generate_empty_date(limit):
+    return ""
+
+
+def _generate_int(limit):
+    return secrets.choice(range(1, 11))
+
+
+@lru_cache(maxsize=1)
+def _faker() -> Faker:
+    # Building Faker loads its locale providers, only pay for it once values are actually needed
+    return Faker()
+
+
+@lru_cache(maxsize=1)
+def _word_pool() -> tuple[str, ...]:
+    # Sampled once, picking from a tuple is far cheaper than a Faker provider call per cell
+    return tuple(_faker().words(nb=VALUE_POOL_SIZE))
+
+
+@lru_cache(maxsize=1)
+def _date_pool() -> tuple:
+    return tuple(_faker().date_this_century() for _ in range(VALUE_POOL_SIZE))
+
+
+def _str_max_length(limit):
+    return min(limit, 50) if limit else 50  # Cap at 50 chars for readability
+
+
+def _generate_str(limit):
+    # Generate string within the specified length limit
+    return secrets.choice(_word_pool())[:_str_max_length(limit) - 1]  # Leave space for safety
+
+
+def _generate_float(limit):
+    return round(secrets.randbelow(10) + secrets.randbits(10) / (2 ** 10), 2)
+
+
+def _decimal_bounds(limit):
+    precision, scale = limit
+    # The integer part keeps at most precision - scale digits (capped at 999999 for safety), so any unscaled
+    # integer below the bound fits the column by construction
+    max_integer_digits = max(precision - scale, 0)
+    integer_bound = min(10 ** max_integer_digits, 10 ** 6)
+    return integer_bound * 10 ** scale, scale
+
+
+def _generate_decimal(limit):
+    unscaled_bound, scale = _decimal_bounds(limit)
+    return Decimal(secrets.randbelow(unscaled_bound)).scaleb(-scale, _DECIMAL_CONTEXT)
+
+
+def _generate_boolean(limit):
+    return secrets.choice([True, False])
+
+
+def _generate_date(limit):
+    return secrets.choice(_date_pool())
+
+
+def _generate_timestamp(limit):
+    # The plan passes the load's single timestamp in place of a limit
+    return limit
+
+
+def _generate_none(limit):
+    return None
+
+
+_GENERATORS_BY_DTYPE = {
+    "int": _generate_int,
+    "str": _generate_str,
+    "float": _generate_float,
+    "decimal": _generate_decimal,
+    "boolean": _generate_boolean,
+    "date": _generate_date,
+    "timestamp": _generate_timestamp,
+}
+
+
+def _generate_int_column(rng, limit, size):
+    return rng.integers(1, 11, size=size).tolist()
+
+
+def _generate_co_nbr_column(rng, limit, size):
+    return [str(value) for value in rng.integers(1, 201, size=size).tolist()]
+
+
+def _generate_float_column(rng, limit, size):
+    values = rng.integers(0, 10, size=size) + rng.integers(0, 2 ** 10, size=size) / (2 ** 10)
+    return np.round(values, 2).tolist()
+
+
+def _generate_boolean_column(rng, limit, size):
+    return (rng.random(size) < 0.5).tolist()
+
+
+def _generate_decimal_column(rng, limit, size):
+    # Unscaled values can exceed int64, so draw them from the Mersenne Twister rather than NumPy
+    unscaled_bound, scale = _decimal_bounds(limit)
+    return [Decimal(_RNG.randrange(unscaled_bound)).scaleb(-scale, _DECIMAL_CONTEXT) for _ in range(size)]
+
+
+def _generate_str_column(rng, limit, size):
+    pool = _word_pool()
+    max_length = _str_max_length(limit) - 1
+    return [pool[index][:max_length] for index in rng.integers(0, len(pool), size=size).tolist()]
+
+
+def _generate_date_column(rng, limit, size):
+    pool = _date_pool()
+    return [pool[index] for index in rng.integers(0, len(pool), size=size).tolist()]
+
+
+def _generate_timestamp_column(rng, limit, size):
+    return [limit] * size
+
+
+# Column-at-a-time equivalents of the per-cell generators, used unless secure randomness is requested, so the
+# default path never pays for the OS CSPRNG. tolist() hands back native Python values so DB drivers never see
+# NumPy scalars
+_COLUMN_GENERATORS = {
+    _generate_int: _generate_int_column,
+    _generate_co_nbr: _generate_co_nbr_column,
+    _generate_float: _generate_float_column,
+    _generate_boolean: _generate_boolean_column,
+    _generate_str: _generate_str_column,
+    _generate_decimal: _generate_decimal_column,
+    _generate_date: _generate_date_column,
+    _generate_timestamp: _generate_timestamp_column,
+}
+
+
+def _build_row_plan(table_schema: dict, now: datetime) -> list[tuple]:
+    # Classify every column once, so generating a row is a plain loop over (column, generator, limit)
+    plan = []
+    for col, (dtype, limit) in table_schema.items():
+        if dtype == "timestamp":
+            # Every row of one load shares the same timestamp
+            limit = now
+        if col == "src_sys_cd":
+            generate = _generate_src_sys_cd
+        elif col == "co_nbr":
+            generate = _generate_co_nbr
+        elif col.endswith("_dt"):
+            generate = _generate_empty_date
+        else:
+            generate = _GENERATORS_BY_DTYPE.get(dtype, _generate_none)
+        plan.append((col, generate, limit))
+    return plan
+
+
+def iter_synthetic_data(table_schema: dict, num_rows: int, secure_random: bool = False) -> Iterator[dict]:
+    """
+    Lazily generate synthetic rows based on a provided table schema
+
+    Rows are built a batch at a time, with each column generated whole from NumPy draws or pre-sampled value pools,
+    so a consumer such as insert_synthetic_data only ever holds one batch in memory
+
+    Args:
+        table_schema (dict): The schema dictionary mapping column names to data types.
+        num_rows (int): The number of rows to generate
+        secure_random (bool): Draw every value from the secrets module instead of NumPy's generator
+
+    Returns:
+        Iterator[dict]: An iterator of dictionaries where each dictionary represents a row of synthetic data.
+    """
+    table_schema = ensure_src_sys_cd_column(table_schema)
+    plan = _build_row_plan(table_schema, datetime.now().replace(microsecond=0))
+    columns = tuple(col for col, _, _ in plan)
+    column_plan = [
+        (generate, None if secure_random else _COLUMN_GENERATORS.get(generate), limit)
+        for _, generate, limit in plan
+    ]
+    rng = np.random.default_rng()
+
+    for start in range(0, num_rows, INSERT_BATCH_SIZE):
+        size = min(INSERT_BATCH_SIZE, num_rows - start)
+        column_values = []
+        for generate, generate_column, limit in column_plan:
+            if generate_column is not None:
+                column_values.append(generate_column(rng, limit, size))
+            else:
+                column_values.append([generate(limit) for _ in range(size)])
+
+        for values in zip(*column_values):
+            yield dict(zip(columns, values))
+
+
+def generate_synthetic_data(table_schema: dict, num_rows: int, secure_random: bool = False) -> list:
     """
     Generate synthetic data based on a provided table schema
 
     Args:
         table_schema (dict): The schema dictionary mapping column names to data types.
         num_rows (int): The number of rows to generate
+        secure_random (bool): Draw every value from the secrets module instead of NumPy's generator
 
     Returns:
         list: A list of dictionaries where each dictionary represents a row of synthetic data.
     """
-    table_schema = ensure_src_sys_cd_column(table_schema)
+    return list(iter_synthetic_data(table_schema, num_rows, secure_random=secure_random))
 
-    def generate_row():
-        row = {}
-        for col, (dtype, limit) in table_schema.items():
-            if col == "src_sys_cd":
-                row[col] = "XYZ"
-            elif col == "co_nbr":
-                row[col] = str(secrets.choice(range(1, 201)))  # Random int as str (1-200)
-            elif re.search(r"_dt$", col):
-                row[col] = ""
-            elif dtype == "int":
-                row[col] = secrets.choice(range(1, 11))
-            elif dtype == "str":
-                # Generate string within the specified length limit
-                max_length = min(limit, 50) if limit else 50  # Cap at 50 chars for readability
-                generated_word = fake.word()[:max_length - 1]  # Leave space for safety
-                row[col] = generated_word
-            elif dtype == "float":
-                row[col] = round(secrets.randbelow(10) + secrets.randbits(10) / (2 ** 10), 2)
-            elif dtype == "decimal":
-                precision, scale = limit
-                # Generate a decimal value that fits within the precision and scale constraints
-                max_integer_digits = precision - scale
-
-                # Ensure we don't exceed the precision
-                if max_integer_digits <= 0:
-                    # If no room for integer part, generate a small fractional number
-                    integer_part = 0
-                else:
-                    max_integer_value = min(10 ** max_integer_digits - 1, 999999)  # Cap for safety
-                    integer_part = secrets.randbelow(max_integer_value + 1)
 
-                if scale > 0:
-                    fractional_part = secrets.randbelow(10 ** scale)
-                    # Format the decimal string properly
-                    decimal_str = f"{integer_part}.{fractional_part:0{scale}d}"
-                else:
-                    decimal_str = str(integer_part)
-
-                decimal_value = Decimal(decimal_str)
-
-                # Ensure the value fits within the precision constraint
-                # Convert to string and check total length (excluding decimal point)
-                decimal_str_check = str(decimal_value).replace('.', '')
-                if len(decimal_str_check) > precision:
-                    # If too long, generate a smaller value
-                    safe_integer_digits = max(1, precision - scale)
-                    safe_integer_value = min(10 ** safe_integer_digits - 1, 999)
-                    if scale > 0:
-                        safe_fractional = secrets.randbelow(10 ** scale)
-                        decimal_value = Decimal(f"{safe_integer_value}.{safe_fractional:0{scale}d}")
-                    else:
-                        decimal_value = Decimal(str(safe_integer_value))
-
-                row[col] = decimal_value
-            elif dtype == "boolean":
-                row[col] = secrets.choice([True, False])
-            elif dtype == "date":
-                row[col] = fake.date_this_century()
-            elif dtype == "timestamp":
-                row[col] = datetime.now().replace(microsecond=0)
-            else:
-                row[col] = None
-        return row
+@lru_cache(maxsize=128)
+def _reflect_table(client, schema_name: str, table_name: str) -> Table:
+    # Reflection queries the catalog, do it once per engine and table rather than on every delete/insert
+    return Table(table_name, MetaData(), autoload_with=client, schema=schema_name)
+
+
+@lru_cache(maxsize=128)
+def _insert_statement(table: Table) -> Insert:
+    # One statement object per reflected table, so every batch and call hits the engine's compiled cache
+    return insert(table)
 
-    return [generate_row() for _ in range(num_rows)]
+
+def _transactional(conn):
+    # Engines from get_engine run in AUTOCOMMIT, step out of it so begin/commit/rollback take effect
+    return conn.execution_options(isolation_level=conn.default_isolation_level)
+
+
+def clear_reflection_cache() -> None:
+    """
+    Drop the cached table reflections and insert statements so the next load reads the table definitions again
+
+    Call this after DDL that may recreate tables, such as the ETL or SCD scripts
+    """
+    _reflect_table.cache_clear()
+    _insert_statement.cache_clear()
 
 
 def delete_synthetic_data(client, schema_name: str, table_name: str) -> None:
@@ -182,36 +378,133 @@ def delete_synthetic_data(client, schema_name: str, table_name: str) -> None:
     Raises:
         sqlalchemy.exc.SQLAlchemyError: If the delete operation fails
     """
-    metadata = MetaData()
-    table = Table(table_name, metadata, autoload_with=client, schema=schema_name)
+    table = _reflect_table(client, schema_name, table_name)
 
     stmt = delete(table).where(table.c.src_sys_cd == "XYZ")
 
     with client.connect() as conn:
-        result = conn.execute(stmt)
+        conn = _transactional(conn)
+        with conn.begin():
+            result = conn.execute(stmt)
 
     if result.rowcount > 0:
         LOGGER.info(f"Deleted {result.rowcount} rows from {schema_name}.{table_name} where src_sys_cd = 'XYZ'")
 
 
-def insert_synthetic_data(client, schema_name: str, table_name: str, synthetic_data: list) -> None:
+def _batch_size_for(client, table: Table) -> int:
+    dialect_name = client.dialect.name
+    if dialect_name == "mssql":
+        return max(1, _MSSQL_MAX_PARAMETERS // max(1, len(table.columns)))
+    return _BATCH_SIZE_BY_DIALECT.get(dialect_name, INSERT_BATCH_SIZE)
+
+
+def _copy_rows(conn, table: Table, rows: list[dict]) -> None:
+    # COPY skips the SQL parser entirely; NULL is spelled \N so empty strings stay empty strings
+    preparer = conn.dialect.identifier_preparer
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_COPY_NULL if row[col] is None else row[col] for col in columns])
+    buffer.seek(0)
+
+    copy_sql = (
+        f"COPY {preparer.format_table(table)} ({', '.join(preparer.quote(col) for col in columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+    )
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+        cursor.close()
+
+
+def insert_synthetic_data(
+        client, schema_name: str, table_name: str, synthetic_data: Iterable[dict],
+        batch_size: int | None = None, commit_every: int | None = None) -> None:
     """
     Inserts synthetic data into a table
 
+    Rows are sent as executemany batches so the driver can use its multi-row insert fast path instead of
+    one statement with every value inlined, or streamed with COPY FROM STDIN on PostgreSQL via psycopg2.
+    Any iterable is accepted, pass iter_synthetic_data to keep memory bounded by the batch size
+
     Args:
         client (sqlalchemy.engine.base.Engine): A SQLAlchemy Engine instance connected to the database
         schema_name (str): The name of the schema
         table_name (str): The name of the table
-        synthetic_data (list): A list of dictionaries representing synthetic rows to insert
+        synthetic_data (Iterable[dict]): Dictionaries representing synthetic rows to insert
+        batch_size (int | None): The number of rows sent per executemany call, chosen from the dialect by default
+        commit_every (int | None): Commit after this many batches to bound transaction size, by default all
+                                   batches are committed together in a single transaction, also on engines
+                                   created with AUTOCOMMIT
 
     Raises:
         sqlalchemy.exc.SQLAlchemyError: If the insert operation fails
     """
-    metadata = MetaData()
-    table = Table(table_name, metadata, autoload_with=client, schema=schema_name)
+    table = _reflect_table(client, schema_name, table_name)
+    batch_size = batch_size or _batch_size_for(client, table)
 
-    stmt = insert(table).values(synthetic_data)
+    stmt = _insert_statement(table)
+    rows = iter(synthetic_data)
+    inserted = 0
 
     with client.connect() as conn:
-        conn.execute(stmt)
-        LOGGER.info(f"Inserted {len(synthetic_data)} rows into {schema_name}.{table_name}")
\ No newline at end of file
+        conn = _transactional(conn)
+        transaction = conn.begin()
+        try:
+            batches = 0
+            use_copy = client.dialect.name == "postgresql" and client.dialect.driver == "psycopg2"
+            while batch := list(islice(rows, batch_size)):
+                if use_copy:
+                    _copy_rows(conn, table, batch)
+                else:
+                    conn.execute(stmt, batch)
+                inserted += len(batch)
+                batches += 1
+                if commit_every and batches % commit_every == 0:
+                    transaction.commit()
+                    transaction = conn.begin()
+            transaction.commit()
+        except Exception:
+            transaction.rollback()
+            raise
+
+    LOGGER.info(f"Inserted {inserted} rows into {schema_name}.{table_name}")
+
+
+async def insert_synthetic_data_async(
+        async_engine, schema_name: str, table_name: str, synthetic_data: Iterable[dict],
+        batch_size: int | None = None) -> None:
+    """
+    Inserts synthetic data into a table through an asyncio engine
+
+    Several tables can be loaded concurrently on one event loop, e.g. with asyncio.gather, so their network
+    round-trips overlap instead of running back to back
+
+    Args:
+        async_engine (sqlalchemy.ext.asyncio.AsyncEngine): An AsyncEngine, e.g. created with
+                                                           create_async_engine("postgresql+asyncpg://...")
+        schema_name (str): The name of the schema
+        table_name (str): The name of the table
+        synthetic_data (Iterable[dict]): Dictionaries representing synthetic rows to insert
+        batch_size (int | None): The number of rows sent per executemany call, chosen from the dialect by default
+
+    Raises:
+        sqlalchemy.exc.SQLAlchemyError: If the insert operation fails
+    """
+    rows = iter(synthetic_data)
+    inserted = 0
+
+    async with async_engine.begin() as conn:
+        # Reflection is synchronous, run it on the connection's sync facade
+        table = await conn.run_sync(
+            lambda sync_conn: Table(table_name, MetaData(), autoload_with=sync_conn, schema=schema_name)
+        )
+        batch_size = batch_size or _batch_size_for(async_engine, table)
+        stmt = insert(table)
+        while batch := list(islice(rows, batch_size)):
+            await conn.execute(stmt, batch)
+            inserted += len(batch)
+
+    LOGGER.info(f"Inserted {inserted} rows into {schema_name}.{table_name}")
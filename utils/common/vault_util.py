@@ -1,10 +1,38 @@
+import time
+from functools import lru_cache
+
 import hvac
 
+# How long a secret read from Vault is served from memory before it is fetched again
+SECRET_CACHE_TTL_SECONDS = 300
+
+# (vault_url, token, secret_path) -> (monotonic expiry time, secret data)
+_SECRET_CACHE: dict[tuple[str, str, str], tuple[float, dict[str, any]]] = {}
+
+
+@lru_cache(maxsize=32)
+def _get_vault_client(vault_url: str, token: str) -> hvac.Client:
+    # One client per server and token so its underlying requests session keeps HTTPS connections alive
+    return hvac.Client(url=vault_url, token=token)
+
+
+def clear_vault_cache() -> None:
+    """
+    Drop every cached Vault secret and client, forcing the next read to go back to Vault
+
+    Examples:
+        >>> clear_vault_cache()
+    """
+    _SECRET_CACHE.clear()
+    _get_vault_client.cache_clear()
+
 
 def load_secrets_from_vault(vault_url: str, token: str, secret_path: str) -> dict[str, any]:
     """
     Retrieve secrets from HashiCorp Vault
 
+    Secrets are cached in memory for SECRET_CACHE_TTL_SECONDS, so repeated reads of the same path skip the round trip
+
     Args:
         vault_url (str): URL of the Vault server
         token (str): Authentication token for Vault
@@ -20,9 +48,16 @@ def load_secrets_from_vault(vault_url: str, token: str, secret_path: str) -> dic
         >>> load_secrets_from_vault("http://vault.example.com", "my-token", "secret/data/app")
         {'db_user': 'admin', 'db_password': 'securepassword'}
     """
-    client = hvac.Client(url=vault_url, token=token)
+    cache_key = (vault_url, token, secret_path)
+    cached = _SECRET_CACHE.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return dict(cached[1])
+
+    client = _get_vault_client(vault_url, token)
     secret = client.secrets.kv.v2.read_secret_version(path=secret_path)
-    return secret["data"]["data"]
+    data = secret["data"]["data"]
+    _SECRET_CACHE[cache_key] = (time.monotonic() + SECRET_CACHE_TTL_SECONDS, dict(data))
+    return data
 
 
 def save_secrets_to_vault(vault_url: str, token: str, secret_path: str, secrets: dict[str, any]) -> None:
@@ -42,5 +77,8 @@ def save_secrets_to_vault(vault_url: str, token: str, secret_path: str, secrets:
         >>> save_secrets_to_vault("http://vault.example.com", "my-token", "secret/data/app",
         ...                        {"db_user": "admin", "db_password": "securepassword"})
     """
-    client = hvac.Client(url=vault_url, token=token)
+    client = _get_vault_client(vault_url, token)
     client.secrets.kv.v2.create_or_update_secret(path=secret_path, secret=secrets)
+
+    # The stored version just changed, make the next read fetch it
+    _SECRET_CACHE.pop((vault_url, token, secret_path), None)
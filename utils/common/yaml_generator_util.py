@@ -1,66 +1,121 @@
 import ast
 import logging
+import os
 import re
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
-from pprint import pprint
 
+import numpy as np
 import pandas as pd
 import yaml
 import json
 from utils.common.github_util import parse_github_url, fetch_file_content
 from utils.common.aws_util import get_secrets_manager_client
-import argparse
+
+try:
+    from yaml import CSafeDumper as _YamlSafeDumper
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml, fall back to the pure-Python loader and dumper
+    from yaml import SafeDumper as _YamlSafeDumper
+    from yaml import SafeLoader as _YamlSafeLoader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# How long team secrets and the S3 mapping are reused before they are fetched again
+REMOTE_CACHE_TTL_SECONDS = 900
+
+# (team_path, env) -> (monotonic expiry time, cached value)
+_SECRETS_CACHE: Dict[tuple, tuple] = {}
+_S3_MAPPING_CACHE: Dict[tuple, tuple] = {}
+
+# Files whose presence marks the framework's project root
+PROJECT_ROOT_MARKERS = frozenset({"README.md", "Dockerfile", "poetry.lock", "pyproject.toml"})
+
+# Stream .xlsx design docs through openpyxl's read-only (SAX) reader with cached values instead of formulas
+_XLSX_READ_OPTIONS = {
+    "engine": "openpyxl",
+    "engine_kwargs": {"read_only": True, "data_only": True, "keep_links": False},
+}
+
+# Design document formats accepted on the command line
+_VALID_SUFFIXES = frozenset({'.xlsx', '.xls', '.csv'})
+
+# Leading rows of an Excel design document scanned for the metadata and the column header row
+HEADER_SCAN_ROWS = 50
+
+# The s3_path dict literal assigned in the S3 source structure module
+_S3_PATH_RE = re.compile(r's3_path\s*=\s*({.*})', re.DOTALL)
+
+# A column list section and the run of "- item" lines that follows it
+_COLUMN_SECTION_RE = re.compile(
+    r"^[ \t]*(?:expected_columns|unique_columns):[ \t]*\n(?:[ \t]*-.*(?:\n|$))*", re.MULTILINE
+)
+# A list item wrapped in matching single or double quotes
+_QUOTED_ITEM_RE = re.compile(r"^([ \t]*- )(['\"])(.*)\2[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _locate_project_root() -> Path | None:
+    # One directory listing per ancestor rather than a stat per marker, and only once per process
+    current_path = Path(__file__).resolve()
+    while current_path != current_path.parent:
+        try:
+            with os.scandir(current_path) as entries:
+                if any(entry.name in PROJECT_ROOT_MARKERS for entry in entries):
+                    return current_path
+        except OSError:  # Not a directory (the module file itself) or unreadable
+            pass
+        current_path = current_path.parent
+    return None
+
+
+def _clone_config(value: Any) -> Any:
+    # Loaded YAML is plain dicts, lists and immutable scalars, so copying only the containers is a full deep copy
+    if isinstance(value, dict):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(item) for item in value]
+    return value
+
+
+def _parse_dict_literal(text: str) -> Dict[str, Any]:
+    # A literal quoted one way and free of escapes parses in json's C scanner, anything else falls back to ast
+    if "\\" not in text and ("'" not in text or '"' not in text):
+        try:
+            return json.loads(text.replace("'", '"'))
+        except json.JSONDecodeError:
+            pass
+    return ast.literal_eval(text)
+
+
+def _cache_get(cache: Dict[tuple, tuple], key: tuple):
+    cached = cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return dict(cached[1])
+    return None
+
 
-class CleanYAMLDumper(yaml.SafeDumper):
+def _cache_put(cache: Dict[tuple, tuple], key: tuple, value: Dict[str, Any]) -> None:
+    cache[key] = (time.monotonic() + REMOTE_CACHE_TTL_SECONDS, dict(value))
+
+
+class CleanYAMLDumper(_YamlSafeDumper):
     """Custom YAML dumper for cleaner output"""
 
     def ignore_aliases(self, data):
         """Prevent anchors/aliases in YAML output"""
         return True
 
-    def write_literal(self, text):
-        """Handle literal strings without quotes when possible"""
-        hints = self.determine_block_hints(text)
-        self.write_indicator('|' + hints, True)
-        if hints[-1:] == '+':
-            self.open_ended = True
-        self.write_line_break()
-        breaks = True
-        start = end = 0
-        while end <= len(text):
-            ch = None
-            if end < len(text):
-                ch = text[end]
-            if breaks:
-                if ch is None or ch not in '\n\x85\u2028\u2029':
-                    if not breaks and ch is not None and ch != ' ' and start < end:
-                        self.write_indent()
-                        self.write(text[start:end])
-                        start = end
-                    if ch is not None:
-                        self.write_indent()
-                    breaks = False
-            else:
-                if ch is None or ch in '\n\x85\u2028\u2029':
-                    self.write(text[start:end])
-                    if ch is not None:
-                        self.write_line_break()
-                    start = end
-                    breaks = True
-            end += 1
-
 
 class YAMLConfigGenerator:
     """Generates YAML configuration files for the data verification framework"""
 
     def __init__(self, project_root: str = None, team_path: str = None, env: str = None, load_strategy: str = None):
-        self.project_root = self._find_project_root()
+        self.project_root = Path(project_root) if project_root else self._find_project_root()
         self.team_path = team_path
         self.custom_conf_path = self.project_root / "custom_conf" / "teams"
         self.env = env
@@ -76,30 +131,30 @@ class YAMLConfigGenerator:
         self.default_config = self._load_default_config()
 
     def _find_project_root(self) -> Path:
-        """Find the project root directory by looking for marker files"""
-        current_path = Path(__file__).resolve()
-        markers = ["README.md", "Dockerfile", "poetry.lock", "pyproject.toml"]
-
-        while current_path != current_path.parent:
-            if any((current_path / marker).exists() for marker in markers):
-                return current_path
-            current_path = current_path.parent
-
-        return Path.cwd()
+        """Find the project root directory from PROJECT_ROOT, or by looking for marker files"""
+        env_root = os.environ.get("PROJECT_ROOT")
+        if env_root:
+            return Path(env_root)
+        return _locate_project_root() or Path.cwd()
 
     def _load_default_config(self) -> Dict[str, Any]:
         """Load the default YAML configuration"""
         if self.default_config_path and self.default_config_path.exists():
             try:
                 with open(self.default_config_path, 'r') as file:
-                    return yaml.safe_load(file)
+                    return yaml.load(file, Loader=_YamlSafeLoader)
             except Exception as e:
                 logger.warning(f"Failed to load default config from {self.default_config_path}: {e}")
 
         return self._get_default_template()
 
     def load_secrets(self) -> Dict[str, Any]:
-        """Load secrets from AWS Secrets Manager"""
+        """Load secrets from AWS Secrets Manager, reusing them for REMOTE_CACHE_TTL_SECONDS"""
+        cache_key = (self.team_path, self.env)
+        cached = _cache_get(_SECRETS_CACHE, cache_key)
+        if cached is not None:
+            return cached
+
         parts = self.team_path.split('/')
         team_key = "_".join(parts)
         secret_path = f"{team_key}/{self.env}/secrets"
@@ -111,10 +166,16 @@ class YAMLConfigGenerator:
         except json.JSONDecodeError:
             secret_dict = {"raw_secret": secret_string}
 
+        _cache_put(_SECRETS_CACHE, cache_key, secret_dict)
         return secret_dict
 
     def _fetch_s3_mapping_from_github(self) -> Dict[str, str]:
-        """Fetch S3 mapping from GitHub repository"""
+        """Fetch S3 mapping from GitHub repository, reusing it for REMOTE_CACHE_TTL_SECONDS"""
+        cache_key = (self.team_path, self.env)
+        cached = _cache_get(_S3_MAPPING_CACHE, cache_key)
+        if cached is not None:
+            return cached
+
         git_url = "https://github.com/SyscoCorporation/seed-eu/blob/stg/scripts/common/EU_S3_SOURCE_STRUCTURE.py"
         try:
             secret_dict = self.load_secrets()
@@ -123,12 +184,13 @@ class YAMLConfigGenerator:
                 repo_owner, repo_name, file_path, branch,
                 secret_dict['seed-eu-git-pat'], run_mode="local"
             )
-            match = re.search(r's3_path\s*=\s*({.*})', json_content, re.DOTALL)
+            match = _S3_PATH_RE.search(json_content)
 
             if match:
                 dictionary_string = match.group(1)
                 try:
-                    s3_path_dict = ast.literal_eval(dictionary_string)
+                    s3_path_dict = _parse_dict_literal(dictionary_string)
+                    _cache_put(_S3_MAPPING_CACHE, cache_key, s3_path_dict)
                     return s3_path_dict
                 except (ValueError, SyntaxError) as e:
                     logger.error(f"Error evaluating dictionary string: {e}")
@@ -166,7 +228,8 @@ class YAMLConfigGenerator:
         try:
             file_ext = Path(file_path).suffix.lower()
             if file_ext in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path, sheet_name=sheet_name) if sheet_name else pd.read_excel(file_path)
+                options = _XLSX_READ_OPTIONS if file_ext == '.xlsx' else {}
+                df = pd.read_excel(file_path, sheet_name=sheet_name or 0, **options)
             elif file_ext == '.csv':
                 df = pd.read_csv(file_path)
             else:
@@ -179,6 +242,41 @@ class YAMLConfigGenerator:
             logger.error(f"Failed to read design document: {e}")
             raise
 
+    def read_design_document_sections(self, file_path: str,
+                                      sheet_name: str = None) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+        """
+        Read a design document as its header band and its column rows
+
+        Excel workbooks are opened once and parsed twice: the first HEADER_SCAN_ROWS rows to find the header row
+        and the metadata, then only the rows below that header. Other formats are read whole and the column rows
+        are left for extract_table_info to slice (None)
+
+        Args:
+            file_path: Path to design document
+            sheet_name: Excel sheet name (optional)
+
+        Returns:
+            Tuple of (header band DataFrame, column rows DataFrame or None)
+        """
+        if Path(file_path).suffix.lower() not in ['.xlsx', '.xls']:
+            return self.read_design_document(file_path, sheet_name), None
+
+        try:
+            options = _XLSX_READ_OPTIONS if Path(file_path).suffix.lower() == '.xlsx' else {}
+            with pd.ExcelFile(file_path, **options) as workbook:
+                sheet = sheet_name if sheet_name else 0
+                header_df = workbook.parse(sheet, nrows=HEADER_SCAN_ROWS)
+                # The band's first sheet row is its column labels, so data row N sits on sheet row N + 1
+                header_row_idx = self.find_header_row(header_df)
+                data_df = workbook.parse(sheet, header=header_row_idx + 1).dropna(how='all')
+
+            logger.info(f"Successfully read design document: {file_path}")
+            return header_df, data_df
+
+        except Exception as e:
+            logger.error(f"Failed to read design document: {e}")
+            raise
+
     def find_header_row(self, df: pd.DataFrame) -> int:
         """Find the row index that contains the actual column headers"""
         expected_headers = [
@@ -186,13 +284,18 @@ class YAMLConfigGenerator:
             'lndp column name', 'edwp column name', 'lndp column type', 'edwp data type'
         ]
 
-        for idx, row in df.iterrows():
-            row_values = [str(val).lower().strip() if pd.notna(val) else "" for val in row]
-            header_matches = sum(1 for header in expected_headers if any(header in cell for cell in row_values))
+        # Lowercase the leading band once, then count per row how many headers appear in any of its cells
+        band = df.head(HEADER_SCAN_ROWS)
+        cells = band.apply(lambda column: column.astype(str).str.lower().str.strip().where(column.notna(), ""))
+        header_matches = sum(
+            cells.apply(lambda column: column.str.contains(header, regex=False)).any(axis=1).astype(int)
+            for header in expected_headers
+        )
 
-            if header_matches >= 3:
-                logger.debug(f"Found header row at index: {idx}")
-                return idx
+        header_rows = band.index[header_matches >= 3].tolist()
+        if header_rows:
+            logger.debug(f"Found header row at index: {header_rows[0]}")
+            return header_rows[0]
 
         logger.debug("Using fallback header row at index: 3")
         return 3  # Fallback to row 3
@@ -235,13 +338,18 @@ class YAMLConfigGenerator:
         unique_columns = []
         for key_col in key_columns:
             # Remove layer identifier for unique columns
-            clean_key = key_col.rsplit(' ', 1)[0] if ' ' in key_col else key_col
-            layer_info = key_col.rsplit(' ', 1)[1] if ' ' in key_col else "both"
+            head, sep, tail = key_col.rpartition(' ')
+            clean_key = head if sep else key_col
+            layer_info = tail if sep else "both"
             unique_columns.append(f"{clean_key} {layer_info}")
         return unique_columns
 
-    def extract_table_info(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Extract table information from design document DataFrame"""
+    def extract_table_info(self, df: pd.DataFrame, data_df: pd.DataFrame = None) -> Dict[str, Any]:
+        """
+        Extract table information from design document DataFrame
+
+        df must hold at least the metadata and header rows, pass data_df when the column rows were read separately
+        """
         table_info = {}
 
         # Extract metadata from top rows
@@ -251,20 +359,28 @@ class YAMLConfigGenerator:
             "dependent scripts": "dependent_scripts"
         }
 
-        for idx, row in df.head(10).iterrows():
-            first_col_value = str(row.iloc[0]).lower() if pd.notna(row.iloc[0]) else ""
-            second_col_value = str(row.iloc[1]) if pd.notna(row.iloc[1]) else ""
+        head = df.head(10)
+        labels = head.iloc[:, 0].astype(str).str.lower().where(head.iloc[:, 0].notna(), "")
+        values = head.iloc[:, 1].astype(str).where(head.iloc[:, 1].notna(), "").to_numpy()
+
+        # A row feeds only the first field whose term its label contains, and a later row overrides an earlier one
+        claimed = np.zeros(len(head), dtype=bool)
+        found = []
+        for search_term, field_name in metadata_fields.items():
+            rows = np.flatnonzero(labels.str.contains(search_term, regex=False).to_numpy() & ~claimed)
+            claimed[rows] = True
+            if len(rows):
+                found.append((rows[0], field_name, values[rows[-1]]))
 
-            for search_term, field_name in metadata_fields.items():
-                if search_term in first_col_value:
-                    table_info[field_name] = second_col_value
-                    break
+        for _, field_name, value in sorted(found):
+            table_info[field_name] = value
 
         # Find header row and process data
-        header_row_idx = self.find_header_row(df)
+        if data_df is None:
+            header_row_idx = self.find_header_row(df)
 
-        df.columns = df.iloc[header_row_idx]
-        data_df = df.iloc[header_row_idx + 1:].reset_index(drop=True).dropna(how='all')
+            df.columns = df.iloc[header_row_idx]
+            data_df = df.iloc[header_row_idx + 1:].reset_index(drop=True).dropna(how='all')
 
         # Column mapping for standardization
         column_mapping = {
@@ -290,18 +406,20 @@ class YAMLConfigGenerator:
         for table_field, column_field in zip(table_fields, column_fields):
             table_info[table_field] = ""
             if column_field in data_df.columns:
-                for _, row in data_df.iterrows():
-                    if pd.notna(row[column_field]) and row[column_field]:
-                        table_info[table_field] = row[column_field]
-                        break
-
-        # Get S3 URI
+                column = data_df[column_field]
+                present = column[column.notna() & column.astype(bool)]
+                if not present.empty:
+                    table_info[table_field] = present.iat[0]
+
+        # Get S3 URI, only a schema-qualified LNDP table can have a mapping so skip the fetch otherwise
+        table_name = (table_info.get('lndp_table_name', '').upper().split(".")[1]
+                      if table_info.get('lndp_table_name') and '.' in table_info.get('lndp_table_name', '')
+                      else "")
+        table_info['source_uri'] = ""
         try:
-            s3_mapping = self._fetch_s3_mapping_from_github()
-            table_name = (table_info.get('lndp_table_name', '').upper().split(".")[1]
-                          if table_info.get('lndp_table_name') and '.' in table_info.get('lndp_table_name', '')
-                          else "")
-            table_info['source_uri'] = s3_mapping.get(table_name, "")
+            if table_name:
+                s3_mapping = self._fetch_s3_mapping_from_github()
+                table_info['source_uri'] = s3_mapping.get(table_name, "")
         except Exception as e:
             logger.warning(f"Could not fetch S3 mapping: {e}")
             table_info['source_uri'] = ""
@@ -313,37 +431,54 @@ class YAMLConfigGenerator:
 
         return table_info
 
+    @staticmethod
+    def _column_or_blank(data_df: pd.DataFrame, column: str) -> pd.Series:
+        """Return a column with missing cells (or a missing column) replaced by empty strings"""
+        if column not in data_df.columns:
+            return pd.Series("", index=data_df.index, dtype=object)
+        series = data_df[column]
+        return series.astype(object).where(series.notna(), "")
+
     def _process_columns(self, data_df: pd.DataFrame, table_info: Dict[str, Any]):
         """Process column information from the DataFrame"""
-        # Initialize column tracking structures
-        column_categories = [
-            'major_columns', 'minor_columns', 'key_columns', 'audit_columns',
-            'nkey_columns', 'skey_columns', 'mandatory_columns', 'not_null_columns'
+        lndp_col = self._column_or_blank(data_df, 'lndp_column_name')
+        lndp_type = self._column_or_blank(data_df, 'lndp_column_type')
+        edwp_col = self._column_or_blank(data_df, 'edwp_column_name')
+        edwp_type = self._column_or_blank(data_df, 'edwp_data_type')
+
+        # Rows need a name and a type on at least one layer, whole-column masks avoid boxing every row
+        has_lndp = lndp_col.astype(bool) & lndp_type.astype(bool)
+        has_edwp = edwp_col.astype(bool) & edwp_type.astype(bool)
+        categorised = (has_lndp | has_edwp) & edwp_col.astype(bool)
+
+        lndp_columns_dict = dict(zip(lndp_col[has_lndp], lndp_type[has_lndp]))
+        edwp_columns_dict = dict(zip(edwp_col[has_edwp], edwp_type[has_edwp]))
+
+        # Categorize by EDWP Column Type
+        edwp_column_type = self._column_or_blank(data_df, 'edwp_column_type').astype(str).str.lower()
+        category_map = {
+            'major': 'major_columns',
+            'minor': 'minor_columns',
+            'key': 'key_columns',
+            'audit': 'audit_columns',
+            'nkey': 'nkey_columns',
+            'skey': 'skey_columns'
+        }
+        for column_type, category in category_map.items():
+            table_info[category] = edwp_col[categorised & edwp_column_type.eq(column_type)].tolist()
+
+        key_mask = categorised & edwp_column_type.eq('key')
+        key_identifier = (pd.Series("both", index=data_df.index)
+                          .mask(~edwp_type.astype(bool), "only_lndp")
+                          .mask(~has_lndp, "only_edwp"))
+        table_info['key_columns'] = [
+            f"{column} {identifier}" for column, identifier in zip(edwp_col[key_mask], key_identifier[key_mask])
         ]
-        for category in column_categories:
-            table_info[category] = []
-
-        lndp_columns_dict = {}
-        edwp_columns_dict = {}
-
-        # Process each row
-        for _, row in data_df.iterrows():
-            lndp_col = row.get('lndp_column_name', '') if pd.notna(row.get('lndp_column_name')) else ""
-            lndp_type = row.get('lndp_column_type', '') if pd.notna(row.get('lndp_column_type')) else ""
-            edwp_col = row.get('edwp_column_name', '') if pd.notna(row.get('edwp_column_name')) else ""
-            edwp_type = row.get('edwp_data_type', '') if pd.notna(row.get('edwp_data_type')) else ""
-
-            if (not lndp_col or not lndp_type) and (not edwp_col or not edwp_type):
-                continue
-
-            # Store column information
-            if lndp_col and lndp_type:
-                lndp_columns_dict[lndp_col] = lndp_type
-            if edwp_col and edwp_type:
-                edwp_columns_dict[edwp_col] = edwp_type
 
-            # Categorize by EDWP Column Type
-            self._categorize_column(row, edwp_col, lndp_col, lndp_type, edwp_col, edwp_type, table_info)
+        # Handle mandatory/null flags
+        mandatory_flag = self._column_or_blank(data_df, 'mandatory_type').astype(str).str.lower()
+        table_info['mandatory_columns'] = edwp_col[categorised & mandatory_flag.eq('mandatory')].tolist()
+        table_info['not_null_columns'] = edwp_col[categorised & mandatory_flag.eq('not null')].tolist()
 
         # Create formatted column lists
         audit_columns_set = set(table_info.get('audit_columns', []))
@@ -352,40 +487,6 @@ class YAMLConfigGenerator:
         )
         table_info['unique_columns'] = self._create_unique_columns(table_info.get('key_columns', []))
 
-    def _categorize_column(self, row, edwp_col: str, lndp_col: str, lndp_type: str,
-                           edwp_col_name: str, edwp_type: str, table_info: Dict[str, Any]):
-        """Categorize columns based on their type and properties"""
-        edwp_column_type = row.get('edwp_column_type', '')
-        if pd.notna(edwp_column_type) and edwp_col:
-            edwp_column_type_lower = str(edwp_column_type).lower()
-
-            category_map = {
-                'major': 'major_columns',
-                'minor': 'minor_columns',
-                'audit': 'audit_columns',
-                'nkey': 'nkey_columns',
-                'skey': 'skey_columns'
-            }
-
-            if edwp_column_type_lower in category_map:
-                table_info[category_map[edwp_column_type_lower]].append(edwp_col)
-            elif edwp_column_type_lower == 'key':
-                key_identifier = "both"
-                if not lndp_col or not lndp_type:
-                    key_identifier = "only_edwp"
-                elif not edwp_col_name or not edwp_type:
-                    key_identifier = "only_lndp"
-                table_info['key_columns'].append(f"{edwp_col} {key_identifier}")
-
-        # Handle mandatory/null flags
-        mandatory_flag = row.get('mandatory_type', '')
-        if pd.notna(mandatory_flag) and edwp_col:
-            mandatory_flag_lower = str(mandatory_flag).lower()
-            if mandatory_flag_lower == 'mandatory':
-                table_info['mandatory_columns'].append(edwp_col)
-            elif mandatory_flag_lower == 'not null':
-                table_info['not_null_columns'].append(edwp_col)
-
     def generate_yaml_config(self, table_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate YAML configuration from extracted table information"""
         config = {}
@@ -492,8 +593,8 @@ class YAMLConfigGenerator:
         if table_info.get('key_columns'):
             business_keys = []
             for key_col in table_info['key_columns']:
-                clean_key = key_col.rsplit(' ', 1)[0] if ' ' in key_col else key_col
-                business_keys.append(clean_key)
+                head, sep, _ = key_col.rpartition(' ')
+                business_keys.append(head if sep else key_col)
             config['scd_info']['business_keys'] = business_keys
 
         # Add major and minor columns
@@ -506,8 +607,7 @@ class YAMLConfigGenerator:
     def _build_test_scope_config(self, config: Dict[str, Any]):
         """Build test scope configuration section"""
         if hasattr(self, 'default_config') and 'test_scope' in self.default_config:
-            import copy
-            config['test_scope'] = copy.deepcopy(self.default_config['test_scope'])
+            config['test_scope'] = _clone_config(self.default_config['test_scope'])
 
             # Modify based on load strategy
             self._modify_test_scope_by_strategy(config['test_scope'])
@@ -588,19 +688,17 @@ class YAMLConfigGenerator:
             self.team_dir.mkdir(parents=True, exist_ok=True)
             output_file = self.team_dir / f"{table_name}.yaml"
 
-            with open(output_file, 'w') as file:
-                yaml.dump(
-                    config,
-                    file,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    indent=2,
-                    Dumper=CleanYAMLDumper,
-                    allow_unicode=True
-                )
+            content = yaml.dump(
+                config,
+                default_flow_style=False,
+                sort_keys=False,
+                indent=2,
+                Dumper=CleanYAMLDumper,
+                allow_unicode=True
+            )
 
-            # Post-process to remove quotes from expected_columns and unique_columns
-            self._clean_yaml_quotes(output_file)
+            # Remove quotes from expected_columns and unique_columns before the single write
+            output_file.write_text(self._clean_yaml_quotes(content), encoding='utf-8')
 
             logger.info(f"YAML configuration saved to: {output_file}")
             return str(output_file)
@@ -609,39 +707,9 @@ class YAMLConfigGenerator:
             logger.error(f"Failed to save YAML configuration: {e}")
             raise
 
-    def _clean_yaml_quotes(self, file_path: str):
-        """Remove unnecessary quotes from YAML file"""
-        with open(file_path, 'r') as file:
-            content = file.read()
-
-        lines = content.split('\n')
-        in_expected_columns = False
-        in_unique_columns = False
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Track which section we're in
-            if stripped == 'expected_columns:':
-                in_expected_columns = True
-                in_unique_columns = False
-            elif stripped == 'unique_columns:':
-                in_unique_columns = True
-                in_expected_columns = False
-            elif stripped and not stripped.startswith('-') and not stripped.startswith(' '):
-                in_expected_columns = False
-                in_unique_columns = False
-
-            # Remove quotes from list items in these sections
-            if (in_expected_columns or in_unique_columns) and stripped.startswith('- '):
-                # Remove surrounding quotes but keep the content
-                if stripped.startswith("- '") and stripped.endswith("'"):
-                    lines[i] = line.replace("- '", "- ").replace("'", "", 1)  # Remove only the first quote from the end
-                elif stripped.startswith('- "') and stripped.endswith('"'):
-                    lines[i] = line.replace('- "', "- ").replace('"', "", 1)  # Remove only the first quote from the end
-
-        with open(file_path, 'w') as file:
-            file.write('\n'.join(lines))
+    def _clean_yaml_quotes(self, content: str) -> str:
+        """Remove unnecessary quotes from the column list items of dumped YAML"""
+        return _COLUMN_SECTION_RE.sub(lambda section: _QUOTED_ITEM_RE.sub(r"\1\3", section.group()), content)
 
     def generate_from_design_doc(self, design_doc_path: str, sheet_name: str = None) -> tuple[str, Dict[str, Any]]:
         """
@@ -656,10 +724,10 @@ class YAMLConfigGenerator:
         """
         try:
             # Read design document
-            df = self.read_design_document(design_doc_path, sheet_name)
+            df, data_df = self.read_design_document_sections(design_doc_path, sheet_name)
 
             # Extract table information
-            table_info = self.extract_table_info(df)
+            table_info = self.extract_table_info(df, data_df)
 
             # Generate YAML configuration
             config = self.generate_yaml_config(table_info)
@@ -698,6 +766,9 @@ class YAMLConfigGenerator:
 
 def main():
     """Main function for command line usage"""
+    # Only the command line entry point parses arguments, library users skip importing argparse
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Generate YAML configuration from design document',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -745,11 +816,13 @@ Examples:
 
     # Validate design document path
     design_doc_path = Path(args.design_doc)
-    if not design_doc_path.exists():
+    try:
+        design_doc_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         print(f"❌ Error: Design document not found: {design_doc_path}")
         return 1
 
-    if design_doc_path.suffix.lower() not in ['.xlsx', '.xls', '.csv']:
+    if design_doc_path.suffix.lower() not in _VALID_SUFFIXES:
         print(f"❌ Error: Unsupported file format: {design_doc_path.suffix}")
         print("Supported formats: .xlsx, .xls, .csv")
         return 1
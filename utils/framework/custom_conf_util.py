@@ -1,14 +1,17 @@
+import copy
 import os
 from pathlib import Path
 from typing import Any, Dict
 
-from utils.common.file_util import load_json_file_in_path
+from utils.common.file_util import load_cached_json_file_in_path
 
 
 def load_layered_settings(file_path: Path, environment: str) -> Dict[str, Any]:
     """
     Load layered settings from a TOML file
 
+    The parsed file is cached until it changes on disk, the returned layer is a copy the caller may mutate
+
     Args:
         file_path (Path): Path to the TOML file.
         environment (str): The environment layer to load (e.g. 'dev', 'stg', 'prod')
@@ -16,11 +19,11 @@ def load_layered_settings(file_path: Path, environment: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Merged settings.
     """
-    settings = load_json_file_in_path(file_path)
+    settings = load_cached_json_file_in_path(file_path)
 
     env_settings = settings.get(environment, {})
 
-    merged_settings = {**env_settings}
+    merged_settings = copy.deepcopy(env_settings)
     return merged_settings
 
 
@@ -179,7 +182,11 @@ def merge_test_scope(default_scope: Dict[str, Any], table_scope: Dict[str, Any])
         if isinstance(default_value, dict) and isinstance(table_value, dict):
             merged_scope[key] = merge_test_scope(default_value, table_value)
         elif isinstance(default_value, list) and isinstance(table_value, list):
-            diff = [val for val in default_value if val not in table_value]
+            try:
+                excluded = set(table_value)
+            except TypeError:  # Unhashable entries, fall back to list membership
+                excluded = table_value
+            diff = [val for val in default_value if val not in excluded]
             merged_scope[key] = diff if diff else None
         elif table_value is None:
             merged_scope[key] = default_value
@@ -214,20 +221,22 @@ def recursive_merge(default_dict: Dict[str, Any], table_dict: Dict[str, Any]) ->
     """
     Recursively merge two dictionaries, raising an error for unknown keys in table_dict
     """
-    merged = {}
+    # Most overlay subtrees are empty, skip the key checks and the walk for them
+    if not table_dict:
+        return dict(default_dict)
 
-    for key, default_value in default_dict.items():
-        if key in table_dict:
-            table_value = table_dict[key]
-            if isinstance(default_value, dict) and isinstance(table_value, dict):
-                merged[key] = recursive_merge(default_value, table_value)
-            else:
-                merged[key] = table_value
-        else:
-            merged[key] = default_value
+    if not table_dict.keys() <= default_dict.keys():
+        key = next(key for key in table_dict if key not in default_dict)
+        raise ValueError(f"New key '{key}' has been configured that is not in the default template config")
+
+    # Copy the default level in one go and visit only the keys the table overrides
+    merged = dict(default_dict)
 
-    for key in table_dict:
-        if key not in default_dict:
-            raise ValueError(f"New key '{key}' has been configured that is not in the default template config")
+    for key, table_value in table_dict.items():
+        default_value = merged[key]
+        if isinstance(default_value, dict) and isinstance(table_value, dict):
+            merged[key] = recursive_merge(default_value, table_value)
+        else:
+            merged[key] = table_value
 
     return merged
@@ -1,3 +1,5 @@
+import logging
+
 from utils.common.s3_util import (check_s3_files_exist,
                                   convert_s3_files_to_utf8,
                                   get_s3_uri_with_bucket_prefix,
@@ -33,15 +35,10 @@ def get_col_mapping_for_layer(reference_layer, test_layer_name, column_info):
 
         LOGGER.info(f"Valid mapping found for key: {map_key}, Proceeding with mapped columns")
 
-        ref_col_list = []
-        trg_col_list = []
-
-        for ref_col in expected_cols:
-            ref_col_list.append(ref_col)
+        ref_col_list = list(expected_cols)
 
-            # If there's a mapped value, use it. Else fallback to ref_col
-            trg_col = mapped_cols_dict.get(ref_col, ref_col)
-            trg_col_list.append(trg_col)
+        # If there's a mapped value, use it. Else fallback to ref_col
+        trg_col_list = [mapped_cols_dict.get(ref_col, ref_col) for ref_col in ref_col_list]
 
         # ref_col_list = layer_cosl_mapping(reference_col_mapping, expected_cols)
         # trg_col_list = layer_cosl_mapping(target_col_mapping, expected_cols)
@@ -99,26 +96,28 @@ def initiate_spectrum_creation(
     create_external_db_if_not_exists(ext_db_client, external_db_name)
 
     # if not in utf-8, convert files source location as utf-8
-    if source_encoding.lower() != 'utf-8':
+    if source_encoding and source_encoding.casefold() != 'utf-8':
         convert_s3_files_to_utf8(src_client, source_bucket, uri, source_encoding, source_file_type)
 
     # check s3 has data either existing or recoverable
     s3_uri = get_s3_uri_with_bucket_prefix(source_bucket, uri)
     s3_has_data = check_s3_files_exist(src_client, source_bucket, uri)
-    s3_has_recoverable_data = list_recoverable_s3_file_versions(src_client, source_bucket, uri)
 
     # if files in s3 then good to create spectrum schema
     if s3_has_data:
         LOGGER.info(f"Files exist in S3 URI: {s3_uri}. No recovery needed.")
 
     # otherwise if s3 has only recoverable data, recover the latest data
-    elif s3_has_recoverable_data:
+    # (object versions are only listed when nothing current exists, it is the costlier call)
+    elif list_recoverable_s3_file_versions(src_client, source_bucket, uri):
         latest_files = recover_latest_s3_files(src_client, source_bucket, uri)
         if latest_files:
             recovered_keys = [file['Key'] for file in latest_files]
             LOGGER.info(f"Recovered the latest data files: {', '.join(recovered_keys)}")
-            s3_uris = [f"s3://{source_bucket}/{file['Key']}" for file in latest_files]
-            LOGGER.debug(f"Full paths for debugging: {s3_uris}")
+            # Only build and format the full URI list when debug records are actually emitted
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                s3_uris = [f"s3://{source_bucket}/{file['Key']}" for file in latest_files]
+                LOGGER.debug(f"Full paths for debugging: {s3_uris}")
         else:
             raise FileNotFoundError(f"No data files found in S3 URI: {s3_uri}")
 
@@ -1,11 +1,15 @@
+from functools import lru_cache
 from pathlib import Path
 
 from utils.common.path_util import convert_underscore_to_nested_path
 
+# Files whose presence marks the framework's project root
+DEFAULT_MARKERS = ("README.md", "Dockerfile", "poetry.lock")
+
 
 def find_project_root(start_path: Path, markers: list[str] | None = None) -> Path:
     """
-    Recursively searches for the project root directory by looking for specific marker files.
+    Walks up from start_path looking for the project root directory by checking for specific marker files.
 
     Args:
         start_path (Path): The starting path for the search.
@@ -18,22 +22,22 @@ def find_project_root(start_path: Path, markers: list[str] | None = None) -> Pat
         FileNotFoundError: If the project root directory cannot be found.
     """
     if markers is None:
-        markers = ["README.md", "Dockerfile", "poetry.lock"]
+        markers = DEFAULT_MARKERS
 
     current_path = start_path.resolve()
 
-    if any((current_path / marker).exists() for marker in markers):
-        return current_path
-
-    if current_path.parent == current_path:
-        raise FileNotFoundError("Project root not found.")
+    while not any((current_path / marker).exists() for marker in markers):
+        if current_path.parent == current_path:
+            raise FileNotFoundError("Project root not found.")
+        current_path = current_path.parent
 
-    return find_project_root(current_path.parent, markers)
+    return current_path
 
 
+@lru_cache(maxsize=1)
 def get_framework_root_path() -> Path:
     """
-    Returns the root directory of the framework.
+    Returns the root directory of the framework, resolved once per process.
 
     Returns:
         Path: The root directory of the framework.
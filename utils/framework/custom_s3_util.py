@@ -1,13 +1,63 @@
-from io import BytesIO
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import yaml
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError
+from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 
 from utils.common.aws_util import get_s3_client
 from utils.framework.custom_logger_util import get_logger
 
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml, fall back to the pure-Python loader
+    from yaml import SafeLoader as _YamlSafeLoader
+
 LOGGER = get_logger()
 
+# Upper bound on concurrent GetObject calls in read_many_table_yamls_from_s3
+_MAX_FETCH_WORKERS = 16
+
+# (bucket, key) -> (ETag, parsed YAML), revalidated against S3 on every read
+_YAML_CACHE: dict[tuple[str, str], tuple[str, Any]] = {}
+
+
+def _is_not_modified(error: ClientError) -> bool:
+    response = error.response
+    return (response.get("Error", {}).get("Code") in ("304", "NotModified")
+            or response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304)
+
+
+def _get_yaml_object(s3_client: Any, bucket_name: str, s3_file_key: str) -> Any:
+    """
+    Fetch and parse a YAML object, reusing the parsed copy while its ETag is unchanged
+
+    A cached object is requested with IfNoneMatch, so an unchanged file costs a 304
+    response instead of a body transfer and a parse. Callers get a deep copy
+    because they modify the returned config in place.
+    """
+    cache_key = (bucket_name, s3_file_key)
+    cached = _YAML_CACHE.get(cache_key)
+
+    if cached is not None:
+        try:
+            s3_response = s3_client.get_object(Bucket=bucket_name, Key=s3_file_key, IfNoneMatch=cached[0])
+        except ClientError as e:
+            if not _is_not_modified(e):
+                raise
+            LOGGER.debug(f"S3 YAML not modified, using cached copy: {s3_file_key}")
+            return copy.deepcopy(cached[1])
+    else:
+        s3_response = s3_client.get_object(Bucket=bucket_name, Key=s3_file_key)
+
+    content = yaml.load(s3_response['Body'].read(), Loader=_YamlSafeLoader)
+
+    etag = s3_response.get('ETag')
+    if etag:
+        _YAML_CACHE[cache_key] = (etag, content)
+        return copy.deepcopy(content)
+    return content
+
 
 def read_table_yaml_from_s3(s3_path_prefix: str, table_name: str, bucket_name: str) -> dict:
     """
@@ -34,20 +84,51 @@ def read_table_yaml_from_s3(s3_path_prefix: str, table_name: str, bucket_name: s
     # Retrieve the S3 client from the AWS utility module
     s3_client = get_s3_client()
 
-    # Construct the full S3 path for the YAML file
-    s3_file_key = f"{s3_path_prefix}{table_name}.yaml"
+    return _read_table_yaml(s3_client, s3_path_prefix, table_name, bucket_name)
 
-    try:
-        # Get the object from S3 using the client
-        s3_response = s3_client.get_object(Bucket=bucket_name, Key=s3_file_key)
 
-        # Read the contents of the file
-        file_content = s3_response['Body'].read()
+def read_many_table_yamls_from_s3(s3_path_prefix: str, table_names: list[str], bucket_name: str,
+                                  max_workers: int = _MAX_FETCH_WORKERS) -> dict[str, dict]:
+    """
+    Reads the YAML files of several tables from an S3 bucket concurrently
+
+    All requests share one S3 client, so the round trips overlap instead of running
+    one after another.
+
+    Args:
+        s3_path_prefix (str): The S3 path prefix leading to the files
+        table_names (list[str]): The names of the tables whose YAML configurations are retrieved
+        bucket_name (str): The name of the S3 bucket
+        max_workers (int): Upper bound on concurrent S3 requests
+
+    Returns:
+        dict[str, dict]: The YAML configuration of each table, in the order of table_names
+
+    Raises:
+        FileNotFoundError: If a YAML file does not exist in the specified S3 path
+        NoCredentialsError: If AWS credentials are not available
+        PartialCredentialsError: If incomplete AWS credentials are provided
+        RuntimeError: For any other error that occurs during the operation
+    """
+    s3_client = get_s3_client()
 
-        # Parse the YAML content
-        yaml_content = yaml.safe_load(BytesIO(file_content))
+    if len(table_names) <= 1:
+        return {name: _read_table_yaml(s3_client, s3_path_prefix, name, bucket_name) for name in table_names}
 
-        return yaml_content
+    # map keeps the input order and re-raises the first failure
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(table_names))) as executor:
+        configs = executor.map(lambda name: _read_table_yaml(s3_client, s3_path_prefix, name, bucket_name),
+                               table_names)
+        return dict(zip(table_names, configs))
+
+
+def _read_table_yaml(s3_client: Any, s3_path_prefix: str, table_name: str, bucket_name: str) -> dict:
+    # Construct the full S3 path for the YAML file
+    s3_file_key = f"{s3_path_prefix}{table_name}.yaml"
+
+    try:
+        # Get the object from S3 and parse the YAML content, unless the cached copy is still current
+        return _get_yaml_object(s3_client, bucket_name, s3_file_key)
 
     except s3_client.exceptions.NoSuchKey:
         raise FileNotFoundError(f"YAML configuration file not in S3: {s3_file_key}")
@@ -88,16 +169,8 @@ def read_default_scope_yml_from_s3(s3_path_prefix: str, scope: str, bucket_name:
     s3_file_key = f"{s3_path_prefix}{scope}.yml"
 
     try:
-        # Get the object from S3 using the client
-        s3_response = s3_client.get_object(Bucket=bucket_name, Key=s3_file_key)
-
-        # Read the contents of the file
-        file_content = s3_response['Body'].read()
-
-        # Parse the YML content
-        yml_content = yaml.safe_load(BytesIO(file_content))
-
-        return yml_content
+        # Get the object from S3 and parse the YML content, unless the cached copy is still current
+        return _get_yaml_object(s3_client, bucket_name, s3_file_key)
 
     except s3_client.exceptions.NoSuchKey:
         raise FileNotFoundError(f"YML configuration file not in S3: {s3_file_key}")
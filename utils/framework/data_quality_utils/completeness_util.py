@@ -1,21 +1,83 @@
+from functools import lru_cache
+
 from utils.common.sqlalchemy_util import read_sql_query
 from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
 
+# (schema, table) -> catalog rows, shared by the checks of one completeness run
+_COLUMN_METADATA_CACHE: dict[tuple[str, str], list[dict]] = {}
+_EXTERNAL_COLUMN_CACHE: dict[tuple[str, str], list[dict]] = {}
+
+
+def clear_schema_cache():
+    """
+    Drop the cached catalog rows so the next check reads the table definitions again
+    """
+    _COLUMN_METADATA_CACHE.clear()
+    _EXTERNAL_COLUMN_CACHE.clear()
+
+
+def _get_columns(client, schema_name, table_name):
+    """
+    Read the information_schema columns of an internal table once and reuse them
+    """
+    cache_key = (schema_name, table_name)
+    if cache_key not in _COLUMN_METADATA_CACHE:
+        query = f"""
+            SELECT column_name, data_type, character_maximum_length, numeric_precision, numeric_scale
+            FROM information_schema.columns
+            WHERE table_schema = '{schema_name}'
+            AND table_name = '{table_name}'
+        """
+        _COLUMN_METADATA_CACHE[cache_key] = read_sql_query(client, query) or []
+    return _COLUMN_METADATA_CACHE[cache_key]
+
+
+def _get_external_columns(client, schema_name, table_name):
+    """
+    Read the svv_external_columns rows of an external table once and reuse them
+    """
+    cache_key = (schema_name, table_name)
+    if cache_key not in _EXTERNAL_COLUMN_CACHE:
+        query = f"""
+            SELECT columnname AS column_name, external_type AS data_type
+            FROM svv_external_columns
+            WHERE schemaname = '{schema_name}'
+            AND tablename = '{table_name}'
+        """
+        _EXTERNAL_COLUMN_CACHE[cache_key] = read_sql_query(client, query) or []
+    return _EXTERNAL_COLUMN_CACHE[cache_key]
+
+
+def _find_columns_with_nulls(client, schema_name, table_name, columns):
+    """
+    Count the NULLs of every column in a single scan and return the columns that have any
+    """
+    LOGGER.debug(f"Checking null values in columns: {', '.join(columns)}")
+
+    null_counts = ",\n            ".join(
+        f"SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END) AS null_count_{idx}"
+        for idx, col in enumerate(columns)
+    )
+    null_query = f"""
+        SELECT {null_counts}
+        FROM {schema_name}.{table_name}
+    """
+    result = read_sql_query(client, null_query)
+    if not result:
+        return []
+
+    # SUM over an empty table is NULL
+    row = result[0]
+    return [col for idx, col in enumerate(columns) if (row.get(f"null_count_{idx}") or 0) > 0]
+
 
 def check_src_missing_column(client, schema_name, table_name, column_names):
     """
     Check for missing columns in an external table
     """
-    query = f"""
-        SELECT columnname AS column_name
-        FROM svv_external_columns
-        WHERE schemaname = '{schema_name}'
-        AND tablename = '{table_name}'
-    """
-    result = read_sql_query(client, query)
-    table_columns = [row["column_name"] for row in result] if result else []
+    table_columns = {row["column_name"] for row in _get_external_columns(client, schema_name, table_name)}
     missing_columns = [col for col in column_names if col not in table_columns]
 
     status = len(missing_columns) == 0
@@ -38,14 +100,7 @@ def check_src_blank_rows(client, schema_name, table_name):
     """
     Identify blank rows in an external table where all values are NULL
     """
-    column_query = f"""
-        SELECT columnname AS column_name
-        FROM svv_external_columns
-        WHERE schemaname = '{schema_name}'
-        AND tablename = '{table_name}'
-    """
-    result = read_sql_query(client, column_query)
-    table_columns = [row["column_name"] for row in result] if result else []
+    table_columns = [row["column_name"] for row in _get_external_columns(client, schema_name, table_name)]
 
     if not table_columns:
         return {
@@ -94,17 +149,7 @@ def check_src_unexpected_nulls(client, schema_name, table_name, test_cols_for_nu
             }
         }
 
-    columns_with_nulls = []
-    for col in test_cols_for_nulls:
-        LOGGER.debug(f"Checking null values in column: {col}")
-        null_query = f"""
-            SELECT COUNT(*) AS null_count FROM {schema_name}.{table_name} 
-            WHERE {col} IS NULL
-        """
-        result = read_sql_query(client, null_query)
-        null_count = result[0]["null_count"] if result else 0
-        if null_count > 0:
-            columns_with_nulls.append(col)
+    columns_with_nulls = _find_columns_with_nulls(client, schema_name, table_name, test_cols_for_nulls)
 
     status = len(columns_with_nulls) == 0
     details = {
@@ -135,15 +180,7 @@ def check_missing_column(client, schema_name, table_name, column_names):
     Returns:
         dict: Dictionary containing status and details about missing columns
     """
-    query = f"""
-        SELECT column_name 
-        FROM information_schema.columns 
-        WHERE table_schema = '{schema_name}' 
-        AND table_name = '{table_name}'
-    """
-
-    result = read_sql_query(client, query)
-    table_columns = [row["column_name"] for row in result] if result else []
+    table_columns = {row["column_name"] for row in _get_columns(client, schema_name, table_name)}
 
     missing_columns = [col for col in column_names if col not in table_columns]
 
@@ -175,15 +212,7 @@ def check_blank_rows(client, schema_name, table_name):
     Returns:
         dict: Dictionary containing status and details about blank rows
     """
-    column_query = f"""
-        SELECT column_name 
-        FROM information_schema.columns 
-        WHERE table_schema = '{schema_name}' 
-        AND table_name = '{table_name}'
-    """
-
-    result = read_sql_query(client, column_query)
-    table_columns = [row["column_name"] for row in result] if result else []
+    table_columns = [row["column_name"] for row in _get_columns(client, schema_name, table_name)]
 
     if not table_columns:
         return {
@@ -244,20 +273,7 @@ def check_unexpected_nulls(client, schema_name, table_name, test_cols_for_nulls)
             }
         }
 
-    columns_with_nulls = []
-
-    for col in test_cols_for_nulls:
-        LOGGER.debug(f"Checking null values in column: {col}")
-
-        null_query = f"""
-            SELECT COUNT(*) AS null_count FROM {schema_name}.{table_name} 
-            WHERE {col} IS NULL
-        """
-        result = read_sql_query(client, null_query)
-        null_count = result[0]["null_count"] if result and "null_count" in result[0] else 0
-
-        if null_count > 0:
-            columns_with_nulls.append(col)
+    columns_with_nulls = _find_columns_with_nulls(client, schema_name, table_name, test_cols_for_nulls)
 
     status = len(columns_with_nulls) == 0
     details = {
@@ -275,6 +291,7 @@ def check_unexpected_nulls(client, schema_name, table_name, test_cols_for_nulls)
     }
 
 
+@lru_cache(maxsize=1024)
 def normalize_external_dtype(dtype):
     dtype = dtype.lower().replace(" ", "")
     return dtype
@@ -283,15 +300,9 @@ def normalize_external_dtype(dtype):
 def validate_external_table_schema(client, schema_name, table_name, converted_cols_dict):
     LOGGER.info(f"Starting schema validation for external table {schema_name}.{table_name}")
 
-    query = f"""
-        SELECT columnname AS column_name, external_type AS data_type
-        FROM svv_external_columns
-        WHERE schemaname = '{schema_name}'
-        AND tablename = '{table_name}'
-    """
-    result = read_sql_query(client, query)
+    result = _get_external_columns(client, schema_name, table_name)
 
-    actual_schema = {row["column_name"]: row["data_type"] for row in result} if result else {}
+    actual_schema = {row["column_name"]: row["data_type"] for row in result}
     discrepancies = []
 
     for col, expected_dtype in converted_cols_dict.items():
@@ -335,6 +346,7 @@ def validate_external_table_schema(client, schema_name, table_name, converted_co
     }
 
 
+@lru_cache(maxsize=1024)
 def normalize_redshift_internal_dtype(dtype):
     dtype = dtype.lower()
     dtype = dtype.replace("character varying", "varchar")
@@ -359,53 +371,37 @@ def validate_internal_table_schema(client, schema_name, table_name, converted_co
     """
     LOGGER.info(f"Starting schema validation for internal table {schema_name}.{table_name}")
 
-    query = f"""
-        SELECT column_name, data_type, character_maximum_length, numeric_precision, numeric_scale
-        FROM information_schema.columns
-        WHERE table_schema = '{schema_name}'
-        AND table_name = '{table_name}'
-    """
-    result = read_sql_query(client, query)
+    result = _get_columns(client, schema_name, table_name)
 
     actual_schema = {}
-    if result:
-        for row in result:
-            col_name = row["column_name"]
-            dtype = row["data_type"].lower()
-
-            if dtype in ('character varying', 'varchar', 'character', 'char'):
-                length = row["character_maximum_length"]
-                actual_dtype = f"{dtype}({length})" if length else dtype
-            elif dtype in ('numeric', 'decimal'):
-                precision = row["numeric_precision"]
-                scale = row["numeric_scale"]
-                actual_dtype = f"{dtype}({precision},{scale})"
-            else:
-                actual_dtype = dtype
-
-            actual_dtype = normalize_redshift_internal_dtype(actual_dtype)
-            actual_schema[col_name] = actual_dtype
+    for row in result:
+        col_name = row["column_name"]
+        dtype = row["data_type"].lower()
+
+        if dtype in ('character varying', 'varchar', 'character', 'char'):
+            length = row["character_maximum_length"]
+            actual_dtype = f"{dtype}({length})" if length else dtype
+        elif dtype in ('numeric', 'decimal'):
+            precision = row["numeric_precision"]
+            scale = row["numeric_scale"]
+            actual_dtype = f"{dtype}({precision},{scale})"
+        else:
+            actual_dtype = dtype
 
-    discrepancies = []
+        actual_dtype = normalize_redshift_internal_dtype(actual_dtype)
+        actual_schema[col_name] = actual_dtype
 
-    for col, expected_dtype in converted_cols_dict.items():
-        LOGGER.debug(f"Checking data types for column '{col}' in internal table...")
-        actual_dtype = actual_schema.get(col)
-
-        normalized_expected_dtype = normalize_redshift_internal_dtype(expected_dtype)
+    normalized_expected = {
+        col: normalize_redshift_internal_dtype(expected_dtype) for col, expected_dtype in converted_cols_dict.items()
+    }
 
-        if actual_dtype is None:
-            discrepancies.append(f"Missing column: '{col}'")
-            LOGGER.warning(f"Column '{col}' is missing in internal table")
-        elif actual_dtype != normalized_expected_dtype:
-            discrepancies.append(
-                f"Type mismatch for '{col}': expected '{normalized_expected_dtype}', found '{actual_dtype}'"
-            )
-            LOGGER.warning(
-                f"Datatype mismatch for '{col}': expected '{normalized_expected_dtype}', got '{actual_dtype}'"
-            )
-        else:
-            LOGGER.debug(f"Column '{col}' matched successfully")
+    # One pass in the order of the expected columns; the aggregated message is logged below
+    discrepancies = [
+        f"Missing column: '{col}'" if col not in actual_schema
+        else f"Type mismatch for '{col}': expected '{expected_dtype}', found '{actual_schema[col]}'"
+        for col, expected_dtype in normalized_expected.items()
+        if actual_schema.get(col) != expected_dtype
+    ]
 
     status = len(discrepancies) == 0
     details = {
@@ -239,7 +239,7 @@ def check_col_and_row_data_consistency(
                 LEFT JOIN trg ON src.row_hash = trg.row_hash
                 WHERE trg.row_hash IS NULL;
                 """
-        print("Generated Query: ", query)
+        LOGGER.debug(f"Generated Query: {query}")
         missing_rows = read_sql_query(engine, query)
 
         status = not bool(missing_rows)  # True if no missing rows, False otherwise
@@ -5,6 +5,22 @@ from utils.framework.custom_logger_util import get_logger
 
 LOGGER = get_logger()
 
+# Column definitions look like 'name TYPE'; the column name is the leading non-space token
+_COLUMN_NAME_RE = re.compile(r'^\S+')
+
+
+def _extract_column_name(column_definition):
+    """
+    Extract the column name (first word) from a column definition
+
+    Raises:
+        ValueError: If the definition does not start with a column name
+    """
+    match = _COLUMN_NAME_RE.match(column_definition)
+    if match is None:
+        raise ValueError(f"Invalid column definition, expected 'name [type]': '{column_definition}'")
+    return match.group()
+
 
 def check_src_column_name_duplicates(engine, schema_name, table_name):
     """
@@ -65,7 +81,7 @@ def check_src_row_duplicates(engine, schema_name, table_name, expected_columns,
     """
 
     # Extract column names (removing extra spaces)
-    expected_columns = [re.match(r'^\S+', col).group() for col in expected_columns]
+    expected_columns = [_extract_column_name(col) for col in expected_columns]
     cols = unique_columns if unique_columns else expected_columns
 
     unique_cols_str = ', '.join(cols)
@@ -162,11 +178,11 @@ def check_trg_latest_row_duplicates(
     """
 
     # Extract clean column names (remove extra spaces)
-    expected_columns = [re.match(r'^\S+', col).group() for col in expected_columns]
+    expected_columns = [_extract_column_name(col) for col in expected_columns]
     cols = unique_columns if unique_columns else expected_columns
 
     unique_cols_str = ', '.join(cols)
-    sys_insert_column = re.match(r'^\S+', sys_insert_column).group()
+    sys_insert_column = _extract_column_name(sys_insert_column)
 
     query = f"""
         WITH latest_batch AS (
@@ -1,6 +1,7 @@
 from utils.common.file_util import load_multiline_sql_file_in_path
-from utils.common.github_util import fetch_file_content, parse_github_url
+from utils.common.github_util import fetch_files_content, parse_github_url
 from utils.common.sqlalchemy_util import read_sql_query, run_sql_query
+from utils.common.synthetic_data_util import clear_reflection_cache
 from utils.framework.custom_logger_util import get_logger
 from utils.framework.data_quality_utils.completeness_util import \
     check_unexpected_nulls
@@ -35,15 +36,19 @@ def get_scd_default_cols(scd_settings):
 
 
 def run_lndp_edwp_script_for_scd_tables(db_client, scd_settings, pat, run_mode):
-    for sql_url in scd_settings.get('lndp_to_edwp_sqls', []):
-        repo_owner, repo_name, branch, file_path = parse_github_url(sql_url)
-
-        # Fetch SQL content
-        sql_content = fetch_file_content(repo_owner, repo_name, file_path, branch, pat, run_mode)
+    file_refs = [parse_github_url(sql_url) for sql_url in scd_settings.get('lndp_to_edwp_sqls', [])]
+    if not file_refs:
+        return
 
-        queries = load_multiline_sql_file_in_path(sql_content)
-        for query in queries:
-            run_sql_query(db_client, query)
+    # Fetch every SQL script in one batched request, then run them in the configured order
+    try:
+        for sql_content in fetch_files_content(file_refs, pat, run_mode):
+            queries = load_multiline_sql_file_in_path(sql_content)
+            for query in queries:
+                run_sql_query(db_client, query)
+    finally:
+        # The scripts may drop and recreate tables, later synthetic data loads must reflect them again
+        clear_reflection_cache()
 
 
 def check_scd_nulls(db_client, edwp_schema_name, edwp_table_name, scd_columns):